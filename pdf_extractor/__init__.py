@@ -0,0 +1,6 @@
+"""PDF extraction package for financial annual reports."""
+
+from .table_extractor import TableExtractor
+from .text_extractor import TextExtractor
+
+__all__ = ['TableExtractor', 'TextExtractor']
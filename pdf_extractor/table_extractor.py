@@ -0,0 +1,1068 @@
+"""Extract candidate financial-statement tables from annual-report PDFs.
+
+pdfplumber is run with several table-detection strategies per page; the
+resulting candidate tables are deduplicated by content signature, scored
+for extraction quality, validated as financial-statement material and
+written out as one CSV per table.  A secondary filtering pass then drops
+narrative/contact tables that slipped through, and a final pass keeps
+only the best-structured CSV per page.
+"""
+
+import csv
+import functools
+import hashlib
+import json
+import logging
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pdfplumber
+import re
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pa_compute
+    import pyarrow.csv as pa_csv
+    _PYARROW_AVAILABLE = True
+except ImportError:
+    _PYARROW_AVAILABLE = False
+
+try:
+    import numba
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+from .utils import get_pdf_output_dirs
+
+# Compiled once at import: the cell loops below run these against every
+# cell of every candidate table, and relying on re's internal pattern
+# cache makes the cost reappear whenever that cache is churned elsewhere.
+_SIG_NUM_RE = re.compile(r'\d+(?:[,，]\d+)*')
+_TEXT_COL_RE = re.compile(r'[一-鿿]|[A-Za-z]{2,}')
+_FINANCIAL_CELL_RE = re.compile(r'\d{1,3}([,，]\d{3})*|\(\d+\)|[\d,，]{2,}')
+_CURRENCY_CHARS = frozenset('人民幣元百千萬億港幣美元€£¥')
+_LEADING_DIGIT_RE = re.compile(r'^\d')
+_HAS_DIGIT_RE = re.compile(r'\d')
+_FINANCIAL_NUM_RE = re.compile(r'\d{1,3}([,，]\d{3})+|\(\d+(\.\d+)?\)|\d+\.\d{2}')
+_INCOMPLETE_NUM_RE = re.compile(r'\d{1,2}[,，]\d{1,2}$')
+_COMPLETE_NUM_RE = re.compile(r'\d{1,3}([,，]\d{3})+')
+_LONG_NUM_RE = re.compile(r'\d{4,}')
+_SHORT_TAIL_RE = re.compile(r'^\d{1,2}$')
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+_UNNAMED_COL_RE = re.compile(r'^Unnamed:\s*\d+$', re.IGNORECASE)
+# The three invalid-header shapes fused into one alternation; one
+# fullmatch per column replaces three anchored match calls.
+_COL_NAME_RE = re.compile(
+    r'(?P<unnamed>Unnamed:\s*\d+)|(?P<numeric>[\d,，\(\)（）\s\.]+)'
+    r'|(?P<special>[^\w一-鿿]+)',
+    re.IGNORECASE)
+_FIRST_COL_NUM_RE = re.compile(r'[\d\s\-–—,，\.]+')
+_SENT_END_RE = re.compile(r'[。！？\.!?]$')
+_FIRST_COL_SPECIAL_RE = re.compile(r'^[–\-—\s]+$')
+_PAGE_NUM_RE = re.compile(r'page(\d+)')
+
+# Contact-block markers fused into one alternation so the secondary
+# filter can test every marker with a single scan per cell.
+_CONTACT_RE = re.compile(
+    r'電話[:：]|傳真[:：]|电话[:：]|传真[:：]|郵編[:：]|邮编[:：]|'
+    r'網址[:：]|网址[:：]|www\.|@|地址|辦事處|办事处',
+    re.IGNORECASE)
+
+# Threshold ladders from _score_from_counts encoded as bound/delta
+# tables; one searchsorted bucket lookup replaces each if/elif chain.
+# The sides are chosen to keep the original strict/non-strict edges.
+_CV_BOUNDS = np.array([0.3, 0.5, 0.7])
+_CV_DELTAS = np.array([15.0, 10.0, 5.0, -5.0])
+_FIRST_COL_BOUNDS = np.array([0.5, 0.8])
+_FIRST_COL_DELTAS = np.array([-5.0, 5.0, 10.0])
+_SIZE_BOUNDS = np.array([10, 50, 100])
+_SIZE_DELTAS = np.array([-5.0, 0.0, 5.0, 10.0])
+
+# Placeholder cells that carry no content (em/en dashes, empty string).
+_EMPTY_DASH_SET = frozenset(('', '–', '-', '—'))
+# Column names that show the header row was lost or synthesized.
+_INVALID_COL_NAMES = frozenset(('Unnamed', '–', '-', '—', ''))
+
+
+if _NUMBA_AVAILABLE:
+    @numba.njit(cache=True)
+    def _reduce_cell_classes(classify, incomplete, short_tail, row_id):
+        """Reduce per-cell class codes to the scoring counters.
+
+        ``classify``: 0 = other, 2 = complete number, 3 = very short
+        numeric stub. ``incomplete`` is kept separate because it can
+        overlap the other classes.
+        """
+        incomplete_count = 0
+        complete_count = 0
+        very_short_count = 0
+        split_count = 0
+        n = classify.shape[0]
+        for i in range(n):
+            code = classify[i]
+            if code == 2:
+                complete_count += 1
+            elif code == 3:
+                very_short_count += 1
+                if i + 1 < n and row_id[i] == row_id[i + 1] and short_tail[i + 1]:
+                    split_count += 1
+            if incomplete[i]:
+                incomplete_count += 1
+        return incomplete_count, complete_count, very_short_count, split_count
+
+    # Warm the JIT at import so the first scored page does not pay
+    # compilation latency (cache=True persists it across runs).
+    _reduce_cell_classes(
+        np.zeros(1, dtype=np.int8), np.zeros(1, dtype=np.bool_),
+        np.zeros(1, dtype=np.bool_), np.zeros(1, dtype=np.int64))
+else:
+    def _reduce_cell_classes(classify, incomplete, short_tail, row_id):
+        """NumPy fallback for the scoring-counter reduction.
+
+        One bincount over the class codes yields every class counter in
+        a single pass instead of one boolean-mask sum per counter.
+        """
+        counts = np.bincount(classify, minlength=4)
+        split_count = 0
+        if classify.shape[0] > 1:
+            split_count = int(
+                ((classify[:-1] == 3) & short_tail[1:]
+                 & (row_id[:-1] == row_id[1:])).sum())
+        return (int(incomplete.sum()), int(counts[2]),
+                int(counts[3]), split_count)
+
+
+def _removal_verdict_py(text_cells, numeric_cells, long_text_cells,
+                        sentence_cells, descriptive_rows, total_cells, rows):
+    """Evaluate the narrative-removal threshold chain on raw counts.
+
+    Returns 0 (keep) or a reason code: 1 text-heavy, 2 long prose,
+    3 sentence-like, 4 descriptive rows. Counts not yet computed may be
+    passed as 0; a zero count can never trip its threshold, which is
+    what lets the staged caller reuse one predicate.
+    """
+    if total_cells <= 0:
+        return 0
+    inv_total = 1.0 / total_cells
+    if text_cells * inv_total > 0.85 and numeric_cells * inv_total < 0.1:
+        return 1
+    if long_text_cells * inv_total > 0.5:
+        return 2
+    if sentence_cells * inv_total > 0.3:
+        return 3
+    if descriptive_rows >= rows * 0.5 and rows >= 2:
+        return 4
+    return 0
+
+
+if _NUMBA_AVAILABLE:
+    _removal_verdict = numba.njit(cache=True)(_removal_verdict_py)
+    _removal_verdict(0, 0, 0, 0, 0, 0, 0)
+else:
+    _removal_verdict = _removal_verdict_py
+
+
+def _score_from_arrays_py(row_counts, col_counts, rows, cols):
+    """Threshold cascade over precomputed per-row/per-column fill counts.
+
+    Pure numeric kernel: the running sum and the population variance of
+    the row counts come from one Welford pass, then the searchsorted
+    delta tables apply the band scores. Written to compile under numba
+    (see the guarded alias below).
+    """
+    score = 0.0
+    non_empty_cells = 0.0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(row_counts.shape[0]):
+        x = float(row_counts[i])
+        non_empty_cells += x
+        delta = x - mean
+        mean += delta / (i + 1)
+        m2 += delta * (x - mean)
+
+    total_cells = rows * cols
+    fill_ratio = non_empty_cells / total_cells
+    mean_row = non_empty_cells / rows
+    if mean_row > 0:
+        cv = (m2 / rows) ** 0.5 / mean_row
+    else:
+        cv = 1.0
+
+    # Even rows mean a real grid rather than a ragged text dump.
+    score += _CV_DELTAS[np.searchsorted(_CV_BOUNDS, cv, side='right')]
+
+    first_col_ratio = col_counts[0] / rows
+    score += _FIRST_COL_DELTAS[
+        np.searchsorted(_FIRST_COL_BOUNDS, first_col_ratio, side='left')]
+
+    score += _SIZE_DELTAS[
+        np.searchsorted(_SIZE_BOUNDS, total_cells, side='right')]
+
+    score += fill_ratio * 20
+    return score
+
+
+if _NUMBA_AVAILABLE:
+    _score_from_arrays = numba.njit(cache=True)(_score_from_arrays_py)
+    _score_from_arrays(np.zeros(1, dtype=np.int64),
+                       np.zeros(1, dtype=np.int64), 1, 1)
+else:
+    _score_from_arrays = _score_from_arrays_py
+
+
+def calculate_structure_score(df):
+    """Score how table-like a CSV frame is (grid evenness, labels, size)."""
+    rows, cols = df.shape
+    if rows == 0 or cols == 0:
+        return -100.0
+    # One boolean fill matrix replaces the per-cell loop; the
+    # row/column counts and the row-evenness statistics are all
+    # axis reductions over it.
+    s = df.astype(str).apply(lambda c: c.str.strip())
+    filled = df.notna().values & ~s.isin(list(_EMPTY_DASH_SET)).values
+    return _score_from_arrays(filled.sum(axis=1), filled.sum(axis=0),
+                              rows, cols)
+
+
+def _score_file_fast(path):
+    """Structure-score a CSV by streaming fill counts with csv.reader.
+
+    Fallback scorer for when pyarrow is missing: no dtype inference and
+    no frame construction, just per-row/per-column non-empty counts fed
+    into the shared threshold cascade.
+    """
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return -100.0
+        cols = len(header)
+        col_counts = [0] * cols
+        row_counts = []
+        for row in reader:
+            non_empty = 0
+            for i, value in enumerate(row):
+                if value:
+                    value = value.strip()
+                    if value and value not in _EMPTY_DASH_SET:
+                        non_empty += 1
+                        if i < cols:
+                            col_counts[i] += 1
+            row_counts.append(non_empty)
+    rows = len(row_counts)
+    if rows == 0 or cols == 0:
+        return -100.0
+    return _score_from_arrays(np.asarray(row_counts), np.asarray(col_counts),
+                              rows, cols)
+
+
+@functools.lru_cache(maxsize=4096)
+def _score_file(path, mtime, size):
+    """Read and structure-score one CSV, memoized on (path, mtime, size).
+
+    The per-page winner selection can score the same file repeatedly
+    across runs and merge passes; mtime/size in the key invalidate the
+    entry automatically when the file is rewritten. Returns ``None``
+    when the file cannot be read.
+    """
+    # Scoring only needs fill counts, so the Arrow path parses the CSV
+    # in C++ and derives the boolean fill mask with compute kernels,
+    # never materializing a pandas frame at all.
+    if _PYARROW_AVAILABLE:
+        try:
+            table = pa_csv.read_csv(
+                path, read_options=pa_csv.ReadOptions(encoding='utf-8-sig'))
+        except Exception:
+            return None
+        rows, cols = table.num_rows, table.num_columns
+        if rows == 0 or cols == 0:
+            return -100.0
+        placeholders = pa.array([v for v in _EMPTY_DASH_SET if v])
+        filled_cols = []
+        for col in table.columns:
+            text = pa_compute.utf8_trim_whitespace(
+                pa_compute.cast(col, pa.string()))
+            nonblank = pa_compute.and_(
+                pa_compute.and_(pa_compute.is_valid(col),
+                                pa_compute.not_equal(text, '')),
+                pa_compute.invert(
+                    pa_compute.is_in(text, value_set=placeholders)))
+            filled_cols.append(
+                pa_compute.fill_null(nonblank, False).to_numpy(
+                    zero_copy_only=False))
+        filled = np.column_stack(filled_cols)
+        return _score_from_arrays(filled.sum(axis=1), filled.sum(axis=0),
+                                  rows, cols)
+    try:
+        return _score_file_fast(path)
+    except Exception:
+        return None
+
+
+def _write_csv(df, output_file):
+    """Write ``df`` as UTF-8-with-BOM CSV.
+
+    pyarrow's CSV writer serializes in C++ and is several times faster
+    than pandas' writer; the BOM is prepended manually since Arrow does
+    not know utf-8-sig. Falls back to ``DataFrame.to_csv`` when pyarrow
+    is unavailable or cannot represent the frame.
+    """
+    if _PYARROW_AVAILABLE:
+        try:
+            arrow_table = pa.Table.from_pandas(df, preserve_index=False)
+            with open(output_file, 'wb') as f:
+                f.write(b'\xef\xbb\xbf')
+                pa_csv.write_csv(arrow_table, f)
+            return
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+    df.to_csv(output_file, index=False, encoding='utf-8-sig')
+
+
+def _frame_cache_key(df):
+    """Stable content key for the secondary filter's decision cache.
+
+    Keyed on content rather than file stat data because the CSVs are
+    rewritten on every extraction run; identical table content must
+    still hit across runs.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr(df.shape).encode())
+    h.update('\x1f'.join(map(str, df.columns)).encode('utf-8'))
+    h.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return h.hexdigest()
+
+
+def _analyze_table(item):
+    """Decide whether one written table is narrative/degenerate.
+
+    Top level (and free of extractor state) so ProcessPoolExecutor can
+    pickle it; receives an (output_file, DataFrame) pair and returns
+    ``(output_file, should_remove, remove_reason)`` without touching the
+    filesystem.
+    """
+    output_file, df_check = item
+    rows, cols = df_check.shape
+    if rows == 0 or cols == 0:
+        return output_file, False, ''
+
+    should_remove = False
+    remove_reason = ''
+
+    # Stringify and strip every cell exactly once; the passes
+    # below all index this shared frame instead of repeating
+    # str()+strip() per cell per pass.
+    # Written frames never hold NaN -- extract_tables pads every cell
+    # to '' -- so emptiness is a string comparison, not isna().
+    s = df_check.astype(str).apply(lambda c: c.str.strip())
+    s_values = s.values
+
+    # Prepass: a first column made only of dashes means the label
+    # column was lost during extraction.
+    col0 = s.iloc[:, 0]
+    col0 = col0[col0 != '']
+    first_col_non_empty_count = int(col0.shape[0])
+    first_col_all_special = (
+        bool(col0.str.fullmatch(_FIRST_COL_SPECIAL_RE.pattern).all())
+        if first_col_non_empty_count else True)
+    if first_col_non_empty_count > 0 and first_col_all_special:
+        should_remove = True
+        remove_reason = 'first column contains only dashes'
+
+    # Main pass: text-heavy/narrative detection.
+    total_cells = 0
+    text_cells = 0
+    long_text_cells = 0
+    sentence_like_cells = 0
+    numeric_cells = 0
+    first_col_long_text_rows = 0
+    descriptive_row_count = 0
+    # The masks are staged cheapest-first: each stage can decide
+    # removal on its own, so the sentence-punctuation regex sweep
+    # only runs for tables that survive the digit and length
+    # ratios.
+    if not should_remove:
+        nonempty = ~s.isin(list(_EMPTY_DASH_SET))
+        has_digit = s.apply(
+            lambda c: c.str.contains(_HAS_DIGIT_RE.pattern, regex=True, na=False))
+        text_mask = nonempty & ~has_digit
+        total_cells = int(nonempty.values.sum())
+        text_cells = int(text_mask.values.sum())
+        numeric_cells = total_cells - text_cells
+        if total_cells > 0:
+            inv_total = 1.0 / total_cells
+            text_ratio = text_cells * inv_total
+            numeric_ratio = numeric_cells * inv_total
+            if _removal_verdict(text_cells, numeric_cells, 0, 0, 0,
+                                total_cells, rows) == 1:
+                should_remove = True
+                remove_reason = (
+                    f'text-heavy table ({text_ratio:.1%} text, '
+                    f'{numeric_ratio:.1%} numeric)')
+
+    if not should_remove and total_cells > 0:
+        cell_len = s.apply(lambda c: c.str.len())
+        long_text_mask = text_mask & (cell_len > 30)
+        long_text_cells = int(long_text_mask.values.sum())
+        long_text_ratio = long_text_cells * inv_total
+        if _removal_verdict(text_cells, numeric_cells, long_text_cells, 0, 0,
+                            total_cells, rows) == 2:
+            should_remove = True
+            remove_reason = (
+                f'mostly long prose cells ({long_text_ratio:.1%} long text, '
+                f'{text_ratio:.1%} text overall)')
+
+    if not should_remove and total_cells > 0:
+        sent_end = s.apply(
+            lambda c: c.str.contains(_SENT_END_RE.pattern, regex=True, na=False))
+        sentence_mask = text_mask & sent_end
+        sentence_like_cells = int(sentence_mask.values.sum())
+        sentence_ratio = sentence_like_cells * inv_total
+        first_col_long_text = long_text_mask.iloc[:, 0].values
+        first_col_long_text_rows = int(first_col_long_text.sum())
+
+        row_non_empty = nonempty.sum(axis=1).values
+        row_text_cells = text_mask.sum(axis=1).values
+        descriptive_row_count = int(
+            ((row_non_empty > 0)
+             & (row_text_cells > 0.6 * row_non_empty)
+             & first_col_long_text).sum())
+
+        verdict = _removal_verdict(
+            text_cells, numeric_cells, long_text_cells, sentence_like_cells,
+            descriptive_row_count, total_cells, rows)
+        if verdict == 3:
+            should_remove = True
+            remove_reason = (
+                f'sentence-like content ({sentence_ratio:.1%} of cells '
+                f'end with sentence punctuation)')
+        elif verdict == 4:
+            should_remove = True
+            remove_reason = (
+                f'descriptive rows dominate '
+                f'({descriptive_row_count}/{rows} rows, '
+                f'{first_col_long_text_rows} long first-column cells)')
+
+    # Contact-information blocks (registered office, hotline...).
+    if not should_remove:
+        stacked = pd.Series(s_values.ravel())
+        stacked = stacked[stacked != '']
+        checked_cells = int(stacked.shape[0])
+        contact_cells = (
+            int(stacked.str.contains(_CONTACT_RE, regex=True).sum())
+            if checked_cells else 0)
+        if checked_cells > 0 and contact_cells / checked_cells > 0.3:
+            should_remove = True
+            remove_reason = (
+                f'contact information block '
+                f'({contact_cells}/{checked_cells} cells)')
+
+    # A first column that is entirely numeric has no row labels.
+    if not should_remove:
+        first_col_arr = s.iloc[:, 0]
+        first_col_arr = first_col_arr[first_col_arr != '']
+        first_col_filled = int(first_col_arr.shape[0])
+        first_col_numeric_count = int(
+            first_col_arr.str.fullmatch(_FIRST_COL_NUM_RE.pattern).sum())
+        if first_col_filled > 2 and first_col_numeric_count == first_col_filled:
+            should_remove = True
+            remove_reason = 'first column entirely numeric (no row labels)'
+
+    # Check 3.5: tiny tables with mostly empty or unnamed columns.
+    if not should_remove and rows <= 5:
+        col_non_empty = (s_values != '').sum(axis=0)
+        empty_cols = int(((col_non_empty == 0)
+                          | (col_non_empty / rows < 0.3)).sum())
+        col_names = df_check.columns.to_series().astype(str).str.strip()
+        invalid_cols = int(
+            (col_names.isin(list(_EMPTY_DASH_SET))
+             | col_names.str.match(_UNNAMED_COL_RE.pattern,
+                                   flags=re.IGNORECASE)).sum())
+        if empty_cols / cols > 0.5 or invalid_cols / cols > 0.5:
+            should_remove = True
+            remove_reason = (
+                f'small table with {empty_cols} empty / '
+                f'{invalid_cols} invalid columns of {cols}')
+
+    return output_file, should_remove, remove_reason
+
+
+def _iter_pages(pdf, page_indices):
+    """Yield one pdfplumber page at a time.
+
+    Indexing ``pdf.pages`` lazily keeps only the current page's object
+    graph alive instead of instantiating every requested Page up front.
+    """
+    for i in page_indices:
+        yield i, pdf.pages[i]
+
+
+def get_table_signature(table):
+    """Build a content signature hash for one candidate table.
+
+    Tables found by several strategies on the same page are
+    usually the same table with slightly different cell
+    splits, so the signature is based on the leading rows'
+    label text plus their digit runs (re-joined when the
+    grid split a thousands-separated number apart).  The
+    signature is hashed so duplicate detection is a single
+    set/dict lookup per table instead of pairwise
+    comparisons across all strategies.
+    """
+    signature_parts = []
+    for row in table[:min(len(table), 5)]:
+        # map/filter keep the stringify-and-drop-empties work in C
+        # instead of a Python generator frame per cell.
+        all_cells_text = ' '.join(map(str, filter(None, row)))
+        # One pass of the tokenizer both finds the digit runs and keeps
+        # comma-split numbers together ("1,234" stays one token), which
+        # the old findall+splice state machine did in Python.
+        combined_numbers = [
+            m.replace(',', '').replace('，', '')
+            for m in _SIG_NUM_RE.findall(all_cells_text)
+        ]
+        first_text_col = ''
+        # Only walk the cells when the joined row text contains label
+        # material at all; numeric-only rows skip the loop entirely.
+        if _TEXT_COL_RE.search(all_cells_text):
+            for cell in row:
+                if not cell:
+                    continue
+                # pdfplumber cells are already str; skip the
+                # str() round-trip when possible.
+                cell_str = cell if type(cell) is str else str(cell)
+                if _TEXT_COL_RE.search(cell_str):
+                    first_text_col = cell_str.strip()
+                    break
+        signature_parts.append(first_text_col + '|' + ','.join(combined_numbers))
+    digest = hashlib.blake2b(
+        '\x1f'.join(signature_parts).encode('utf-8'), digest_size=8)
+    return int.from_bytes(digest.digest(), 'big')
+
+
+def score_table_quality(table):
+    """Score extraction quality, penalising split numbers.
+
+    A strategy that cut "1,234,567" into "1,23" + "4,567"
+    produces tell-tale truncated patterns; those tables
+    score far below a clean extraction of the same data.
+    """
+    # Normalize every cell exactly once; both the pre-scan and the
+    # vectorized pass work from this buffer.
+    row_lengths = [len(row) for row in table]
+    flat = [str(cell).strip() if cell else '' for row in table for cell in row]
+    total_cells = len(flat)
+    if total_cells == 0:
+        return -100
+
+    # Fast pre-scan: a sample dominated by truncated "X,YY" stubs already
+    # guarantees a disqualifying penalty, so bail before the full pass.
+    sample = flat[:sum(row_lengths[:20])]
+    sample_cells = sum(1 for cell_str in sample if cell_str)
+    sample_hits = sum(
+        1 for cell_str in sample
+        if cell_str and _INCOMPLETE_NUM_RE.search(cell_str))
+    if sample_cells and sample_hits / sample_cells > 0.05:
+        return -100
+
+    # One C-level regex pass per pattern over the flattened cells
+    # replaces four Python-level re calls per cell.
+    s = pd.Series(flat, dtype=object)
+    nonempty = (s != '').to_numpy()
+    countable = nonempty & ~s.isin(_EMPTY_DASH_SET).to_numpy()
+    incomplete = s.str.contains(_INCOMPLETE_NUM_RE.pattern, regex=True).to_numpy() & countable
+    complete = s.str.contains(_COMPLETE_NUM_RE.pattern, regex=True).to_numpy() & countable
+    long_num = s.str.contains(_LONG_NUM_RE.pattern, regex=True).to_numpy() & countable & ~complete
+    has_digit = s.str.contains(_HAS_DIGIT_RE.pattern, regex=True).to_numpy() & countable
+    other_numeric = has_digit & ~complete & ~long_num
+    very_short = (other_numeric
+                  & (s.str.count(r'\d').to_numpy() <= 2)
+                  & (s.str.len().to_numpy() <= 4))
+
+    empty_cells = int((~nonempty).sum())
+    numeric_cells = int(has_digit.sum())
+
+    # Collapse the per-cell classes to an int8 code array and run the
+    # counter/adjacency reduction as one (optionally JIT-compiled)
+    # kernel. A "X,YY" stub followed by a 1-2 digit cell in the same
+    # row means a number was cut by the grid.
+    classify = np.zeros(total_cells, dtype=np.int8)
+    classify[complete] = 2
+    classify[very_short] = 3
+    short_tail = s.str.match(_SHORT_TAIL_RE.pattern).to_numpy() & nonempty
+    row_id = np.repeat(np.arange(len(row_lengths)), row_lengths)
+    (incomplete_number_patterns, complete_numbers,
+     very_short_numeric_cells, split_numbers) = _reduce_cell_classes(
+        classify, incomplete, short_tail, row_id)
+
+    score = 0
+    score += complete_numbers * 3
+    score -= incomplete_number_patterns * 50
+    score -= split_numbers * 10
+    score -= very_short_numeric_cells * 2
+    if empty_cells / total_cells > 0.6:
+        score -= 20
+    if numeric_cells > 0:
+        score += min(numeric_cells, 30)
+    return score
+
+
+__all__ = ['TableExtractor']
+
+
+class TableExtractor:
+    """Extract tables from a PDF and keep only financial-statement candidates."""
+
+    # pdfplumber settings tried per page, roughly strictest to loosest.
+    TABLE_SETTINGS = [
+        {'vertical_strategy': 'lines', 'horizontal_strategy': 'lines'},
+        {'vertical_strategy': 'lines', 'horizontal_strategy': 'text'},
+        {'vertical_strategy': 'text', 'horizontal_strategy': 'lines'},
+        {'vertical_strategy': 'text', 'horizontal_strategy': 'text'},
+        {'vertical_strategy': 'lines', 'horizontal_strategy': 'lines',
+         'snap_tolerance': 5},
+        {'vertical_strategy': 'text', 'horizontal_strategy': 'text',
+         'text_tolerance': 5},
+    ]
+
+    # Keywords that mark a table as financial-statement material.
+    FINANCIAL_KEYWORDS = [
+        '資產', '负债', '負債', '资产', '收入', '收益', '利潤', '利润',
+        '現金', '现金', '權益', '权益', '成本', '費用', '费用', '稅',
+        '税', '折舊', '折旧', '攤銷', '摊销', '合計', '合计', '總計',
+        '总计', '年度', '截至', '千元', '百萬', '百万', '附註', '附注',
+    ]
+
+    def __init__(self, output_dir='output'):
+        self.output_dir = output_dir
+        self.logger = logging.getLogger(__name__)
+
+    def extract_tables(self, pdf_path, pages=None):
+        """Extract tables from ``pdf_path`` and return the written CSV paths.
+
+        ``pages`` is an optional set of 1-based page numbers; when omitted
+        every page is processed.
+        """
+        dirs = get_pdf_output_dirs(self.output_dir, pdf_path)
+        tables_dir = dirs['tables']
+        output_files = []
+        # Written DataFrames are kept alongside their paths so the
+        # secondary filter can analyse them without re-reading the CSVs.
+        written_tables = []
+        # Structurally identical tables recur across pages and groups;
+        # remember each validation verdict by content hash.
+        validated_tables = {}
+        validated_frames = {}
+
+        with pdfplumber.open(pdf_path) as pdf:
+            if pages:
+                page_indices = [p - 1 for p in pages if 0 < p <= len(pdf.pages)]
+            else:
+                page_indices = list(range(len(pdf.pages)))
+            for page_idx, page in _iter_pages(pdf, page_indices):
+                page_number = page_idx + 1
+
+                all_tables = []
+                for table_settings in self.TABLE_SETTINGS:
+                    try:
+                        tables = page.extract_tables(table_settings)
+                    except Exception as exc:
+                        self.logger.debug(
+                            'Strategy %s failed on page %s: %s',
+                            table_settings, page_number, exc)
+                        continue
+                    for table in tables:
+                        if table and len(table) >= 2:
+                            all_tables.append(table)
+
+                if not all_tables:
+                    continue
+
+                # Strategies frequently agree exactly; drop byte-identical
+                # candidates before any signature or scoring work.
+                seen_hashes = set()
+                dedup_tables = []
+                for table in all_tables:
+                    content_hash = hash(tuple(map(tuple, table)))
+                    if content_hash not in seen_hashes:
+                        seen_hashes.add(content_hash)
+                        dedup_tables.append(table)
+
+                # Group candidates by signature hash: one dict insert per
+                # table instead of comparing every table against every
+                # other across the six strategies.
+                table_groups = {}
+                for table in dedup_tables:
+                    sig = get_table_signature(table)
+                    if sig not in table_groups:
+                        table_groups[sig] = []
+                    table_groups[sig].append(table)
+
+                # The same table object can show up in several scoring
+                # paths on one page; memoize by object identity so each
+                # is scored at most once.
+                score_cache = {}
+
+                def _score(t):
+                    key = id(t)
+                    value = score_cache.get(key)
+                    if value is None:
+                        value = score_table_quality(t)
+                        score_cache[key] = value
+                    return value
+
+                kept_tables = []
+                for sig, group in table_groups.items():
+                    if len(group) == 1:
+                        best_table = group[0]
+                        best_score = _score(group[0])
+                    else:
+                        # Keep only the highest-quality extraction of the
+                        # duplicated table.
+                        scored = [(_score(t), t) for t in group]
+                        best_score, best_table = max(scored, key=lambda pair: pair[0])
+                    if best_score <= -50:
+                        self.logger.debug(
+                            'Dropped low-quality table on page %s (score %s)',
+                            page_number, best_score)
+                        continue
+                    # Thread the width along so downstream padding
+                    # does not rescan the rows.
+                    kept_tables.append((best_table, max(map(len, best_table))))
+
+                table_count = 0
+                for table_data, max_cols in kept_tables:
+                    # Pad once, then compute the keep-this-row mask as a
+                    # single vectorized strip/compare instead of a
+                    # Python any() per row.
+                    padded = [
+                        [cell if cell is not None else '' for cell in row]
+                        + [''] * (max_cols - len(row))
+                        for row in table_data
+                    ]
+                    arr = np.array(padded, dtype=object)
+                    str_arr = np.char.strip(arr.astype(str))
+                    keep = (str_arr != '').any(axis=1)
+                    filtered_table = arr[keep].tolist()
+                    if len(filtered_table) < 2:
+                        continue
+                    table_key = hash(tuple(tuple(row) for row in filtered_table))
+                    verdict = validated_tables.get(table_key)
+                    if verdict is None:
+                        verdict = self._is_financial_statement_table(filtered_table)
+                        validated_tables[table_key] = verdict
+                    if not verdict:
+                        continue
+
+                    df = pd.DataFrame(filtered_table[1:], columns=filtered_table[0])
+
+                    # Headers made of placeholder/numeric junk mean the first
+                    # row was data, not a header.
+                    invalid_header_cols = 0
+                    for col in df.columns:
+                        col_str = str(col).strip()
+                        if (col_str in _INVALID_COL_NAMES
+                                or _COL_NAME_RE.fullmatch(col_str)):
+                            invalid_header_cols += 1
+                    if invalid_header_cols > len(df.columns) / 2:
+                        df = pd.DataFrame(filtered_table)
+
+                    # Drop completely empty columns (keep the label column)
+                    # with a single vectorized mask instead of two full
+                    # passes per column.
+                    if len(df.columns) > 1:
+                        str_df = df.astype(str).apply(lambda s: s.str.strip())
+                        # Cells were padded to '' above, so no isna()
+                        # term is needed.
+                        empty_mask = str_df == ''
+                        # Positional, not label-based: duplicate header
+                        # labels (two 金額 columns, say) make a label
+                        # lookup return a frame and break the check.
+                        empty_all = empty_mask.to_numpy().all(axis=0)
+                        keep = [0] + [i for i in range(1, df.shape[1])
+                                      if not empty_all[i]]
+                        if len(keep) < df.shape[1]:
+                            df = df.iloc[:, keep]
+
+                    # df is derived deterministically from filtered_table,
+                    # so the same key covers the frame verdict.
+                    frame_verdict = validated_frames.get(table_key)
+                    if frame_verdict is None:
+                        frame_verdict = self._is_valid_dataframe(df)
+                        validated_frames[table_key] = frame_verdict
+                    if not frame_verdict:
+                        continue
+
+                    table_count += 1
+                    output_file = os.path.join(
+                        tables_dir, f'page{page_number}_table{table_count}.csv')
+                    _write_csv(df, output_file)
+                    output_files.append(output_file)
+                    written_tables.append((output_file, df))
+                    self.logger.info('Extracted table: %s', output_file)
+
+                # Release the page's cached char/line streams before the
+                # next page is instantiated.
+                page.flush_cache()
+
+        self._secondary_filter(output_files, written_tables)
+        self._remove_duplicate_tables(output_files)
+        return output_files
+
+    def _secondary_filter(self, output_files, written_tables):
+        """Secondary filtering: drop narrative/contact tables already written.
+
+        Works on the in-memory DataFrames produced by
+        :meth:`extract_tables` (disk is only touched to delete); files
+        judged to be prose, contact blocks or degenerate tables are
+        deleted and removed from ``output_files`` in place.
+        """
+        cache_path = None
+        cache = {}
+        cache_dirty = False
+        if written_tables:
+            cache_path = os.path.join(
+                os.path.dirname(written_tables[0][0]), '.filter_cache.json')
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+            except (OSError, ValueError):
+                cache = {}
+
+        # Cached decisions are resolved up front; only unseen tables go
+        # to the worker pool.
+        decisions = {}
+        keys = {}
+        pending = []
+        for item in written_tables:
+            output_file, df_check = item
+            cache_key = _frame_cache_key(df_check)
+            keys[output_file] = cache_key
+            cached = cache.get(cache_key)
+            if cached is not None:
+                decisions[output_file] = tuple(cached)
+            else:
+                pending.append(item)
+
+        # Each table is analyzed independently, so uncached ones are
+        # farmed out across cores; cache writes, accounting and file
+        # deletion stay in this process.
+        if len(pending) > 1:
+            with ProcessPoolExecutor() as executor:
+                results = list(
+                    executor.map(_analyze_table, pending, chunksize=8))
+        else:
+            results = [_analyze_table(item) for item in pending]
+        for output_file, should_remove, remove_reason in results:
+            decisions[output_file] = (should_remove, remove_reason)
+            cache[keys[output_file]] = [should_remove, remove_reason]
+            cache_dirty = True
+
+        for output_file, df_check in list(written_tables):
+            should_remove, remove_reason = decisions.get(
+                output_file, (False, ''))
+            if should_remove:
+                try:
+                    os.remove(output_file)
+                    output_files.remove(output_file)
+                    written_tables.remove((output_file, df_check))
+                    self.logger.info(
+                        'Removed low-value table file: %s (%s)',
+                        output_file, remove_reason)
+                except OSError as exc:
+                    self.logger.warning(
+                        'Could not remove %s: %s', output_file, exc)
+
+        if cache_dirty and cache_path is not None:
+            try:
+                with open(cache_path, 'w', encoding='utf-8') as f:
+                    json.dump(cache, f, ensure_ascii=False)
+            except OSError as exc:
+                self.logger.warning('Could not write filter cache: %s', exc)
+
+    def _remove_duplicate_tables(self, output_files):
+        """Step 3: keep only the best-structured CSV per page.
+
+        Different strategies can survive the earlier filters with the same
+        underlying table; the candidate whose structure score is highest
+        wins, the rest are deleted.
+        """
+        files_by_page = defaultdict(list)
+        ungrouped_files = []
+        page_search = _PAGE_NUM_RE.search
+        basename = os.path.basename
+        for output_file in output_files:
+            match = page_search(basename(output_file))
+            if match:
+                files_by_page[int(match.group(1))].append(output_file)
+            else:
+                ungrouped_files.append(output_file)
+
+        def _stat_score(file_path):
+            try:
+                return _score_file(file_path,
+                                   os.path.getmtime(file_path),
+                                   os.path.getsize(file_path))
+            except OSError:
+                return None
+
+        # Scoring a candidate is an independent read + reduction, so the
+        # contended files are scored concurrently (the readers release
+        # the GIL in Arrow/pandas C code); winner picks and deletions
+        # stay serial below.
+        contended = [
+            file_path
+            for page_files in files_by_page.values() if len(page_files) > 1
+            for file_path in page_files
+        ]
+        scores = {}
+        if len(contended) > 1:
+            workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for file_path, file_score in zip(
+                        contended, executor.map(_stat_score, contended)):
+                    scores[file_path] = file_score
+        else:
+            scores = {file_path: _stat_score(file_path)
+                      for file_path in contended}
+
+        for page_num, page_files in files_by_page.items():
+            if len(page_files) <= 1:
+                continue
+            best_file = None
+            best_score = float('-inf')
+            for file_path in page_files:
+                file_score = scores.get(file_path)
+                if file_score is None:
+                    continue
+                if file_score > best_score:
+                    best_score = file_score
+                    best_file = file_path
+            if best_file is None:
+                continue
+            removed = []
+            for file_path in page_files:
+                if file_path == best_file:
+                    continue
+                # EAFP: a failed stat costs as much as the remove itself
+                # and the exists/remove pair is racy anyway.
+                try:
+                    os.remove(file_path)
+                except FileNotFoundError:
+                    pass
+                if file_path in output_files:
+                    output_files.remove(file_path)
+                removed.append(file_path)
+            if removed:
+                self.logger.info(
+                    'Removed %d duplicate tables for page %s: %s',
+                    len(removed), page_num, ', '.join(removed))
+
+    def _is_financial_statement_table(self, table, min_cols=2):
+        """Heuristic test that a raw table looks like financial-statement data."""
+        if not table:
+            return False
+        non_empty_rows = [
+            row for row in table
+            if any(cell and str(cell).strip() for cell in row)
+        ]
+        if len(non_empty_rows) < 2:
+            return False
+        max_cols = max(len(row) for row in non_empty_rows)
+        if max_cols < min_cols:
+            return False
+
+        # Fast reject on cheap structural features before any regex runs:
+        # a table with almost no text, or a huge sparse grid of stub
+        # cells, cannot pass the checks below anyway.
+        cell_count = max_cols * len(non_empty_rows)
+        total_char_count = sum(
+            len(str(cell)) for row in non_empty_rows for cell in row if cell)
+        if total_char_count < 20:
+            return False
+        if cell_count > 2000 and total_char_count / cell_count < 3:
+            return False
+
+        total_cells = 0
+        numeric_cells = 0
+        keyword_hits = 0
+        has_currency = False
+        # Bind the loop's global/attribute lookups to locals once; the
+        # cell loop below is the last pure-Python per-cell path and each
+        # LOAD_GLOBAL/LOAD_ATTR would otherwise repeat per cell.
+        empty_cells = _EMPTY_DASH_SET
+        financial_search = _FINANCIAL_CELL_RE.search
+        currency_isdisjoint = _CURRENCY_CHARS.isdisjoint
+        keywords = self.FINANCIAL_KEYWORDS
+        for row in non_empty_rows:
+            for cell in row:
+                if cell is None or cell == '':
+                    continue
+                # pdfplumber cells are already str; avoid the str() call
+                # and only strip when whitespace is actually present.
+                cell_str = cell if type(cell) is str else str(cell)
+                # isspace() covers everything strip() removes, \r and
+                # the full-width 　 padding included.
+                if cell_str and (cell_str[0].isspace()
+                                 or cell_str[-1].isspace()):
+                    cell_str = cell_str.strip()
+                if cell_str in empty_cells:
+                    continue
+                total_cells += 1
+                if financial_search(cell_str):
+                    numeric_cells += 1
+                if not has_currency and not currency_isdisjoint(cell_str):
+                    has_currency = True
+                for keyword in keywords:
+                    if keyword in cell_str:
+                        keyword_hits += 1
+                        break
+        if total_cells == 0:
+            return False
+        numeric_ratio = numeric_cells / total_cells
+        return numeric_ratio >= 0.2 and (keyword_hits >= 1 or has_currency)
+
+    def _is_valid_dataframe(self, df):
+        """Validate the cleaned DataFrame before writing it out."""
+        if df.empty or len(df.columns) < 2:
+            return False
+        rows = len(df)
+
+        # Single fused pass over the cells: stack the frame once and
+        # derive every feature mask from the same stringified Series
+        # instead of re-scanning the DataFrame per check. Columns are
+        # relabelled positionally first so the first-column mask below
+        # cannot be inflated by duplicate header labels.
+        cells = df.set_axis(range(df.shape[1]), axis=1).stack()
+        if cells.empty:
+            return False
+        cells_str = cells.astype(str).str.strip()
+        non_dash = ~cells_str.isin(_EMPTY_DASH_SET)
+        has_digit = cells_str.str.contains(_HAS_DIGIT_RE.pattern, regex=True)
+        is_long_text = cells_str.str.len() > 30
+        is_financial_num = cells_str.str.contains(_FINANCIAL_NUM_RE.pattern, regex=True)
+        first_col_mask = cells.index.get_level_values(1) == 0
+
+        # First column should carry row labels, not numbers.
+        starts_digit = cells_str.str.match(_LEADING_DIGIT_RE.pattern)
+        label_count = int((first_col_mask & non_dash & ~starts_digit).sum())
+
+        # Large tables should be balanced between labels and figures.
+        if rows * len(df.columns) > 50:
+            text_count = int((non_dash & is_long_text).sum())
+            numeric_count = int((non_dash & has_digit & ~is_long_text).sum())
+            if numeric_count == 0:
+                return False
+            if text_count > numeric_count * 3:
+                return False
+
+        # At least one properly formatted financial number must survive.
+        if not bool(is_financial_num.any()) and rows > 3:
+            return False
+
+        return label_count >= 1 or rows <= 3
@@ -0,0 +1,82 @@
+"""Shared filesystem helpers for the PDF extractors."""
+
+import functools
+import os
+import re
+import types
+
+# Compiled once: sanitize_filename runs for every output directory and
+# file name, and per-call re.sub pays a pattern-cache lookup each time.
+_SANITIZE_RE = re.compile(r'[^\w\-.]')
+
+# Directories this process has already created; os.makedirs stats every
+# path component even with exist_ok, so known paths skip the syscalls.
+_KNOWN_DIRS = set()
+
+
+def _ensure_dir(path):
+    if path not in _KNOWN_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _KNOWN_DIRS.add(path)
+
+
+@functools.lru_cache(maxsize=8)
+def open_pdf(path, mtime):
+    """Return a shared PyMuPDF document handle for ``(path, mtime)``.
+
+    Opening a PDF re-parses its xref tables, and the text, table and
+    image extractors frequently process the same report back to back.
+    The handle is cached per content version -- the mtime in the key
+    invalidates it once the file changes -- and callers must not close
+    it; evicted documents are closed by PyMuPDF when garbage-collected.
+    """
+    import fitz
+    return fitz.open(path)
+
+
+def sanitize_filename(filename):
+    """Replace characters that are unsafe in file names with underscores."""
+    return _SANITIZE_RE.sub('_', filename)
+
+
+@functools.lru_cache(maxsize=256)
+def get_pdf_output_dirs(output_dir, pdf_path):
+    """Build (and create) the per-PDF output directory layout.
+
+    Every PDF gets its own sub-directory under ``output_dir`` holding the
+    extracted tables, text and images, so results from different reports
+    never collide. Each extractor asks for the same layout, so the
+    result is memoized per ``(output_dir, pdf_path)``; the returned
+    mapping is read-only because all callers share one cached object.
+    """
+    pdf_name = sanitize_filename(os.path.splitext(os.path.basename(pdf_path))[0])
+    base_dir = os.path.join(output_dir, pdf_name)
+    dirs = {
+        'base': base_dir,
+        'tables': os.path.join(base_dir, 'tables'),
+        'text': os.path.join(base_dir, 'text'),
+        'images': os.path.join(base_dir, 'images'),
+    }
+    _ensure_dir(dirs['base'])
+    _ensure_dir(dirs['tables'])
+    _ensure_dir(dirs['text'])
+    _ensure_dir(dirs['images'])
+    return types.MappingProxyType(dirs)
+
+
+def parse_page_ranges(pages_str):
+    """Parse a page specification like ``"1-3,7,10-12"`` into a set of ints."""
+    # Collect everything into one flat list and hash it in a single
+    # set() construction instead of paying per-element set inserts for
+    # each range part.
+    out = []
+    for part in pages_str.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            start, end = part.split('-', 1)
+            out.extend(range(int(start), int(end) + 1))
+        else:
+            out.append(int(part))
+    return set(out)
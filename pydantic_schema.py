@@ -0,0 +1,30 @@
+"""Pydantic argument schemas for the financial-data agent tools."""
+
+from typing import Annotated, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+
+
+class FinancialDataParams(BaseModel):
+    """Arguments an agent passes to the data-collection tool."""
+
+    # Frozen + extra='forbid' keeps pydantic-core on its immutable fast
+    # path for every model_validate call in the agent loop: no
+    # __setattr__ machinery and no extra-field dict allocation.
+    model_config = ConfigDict(
+        frozen=True,
+        extra='forbid',
+        str_strip_whitespace=True,
+        validate_assignment=False,
+    )
+
+    company_name: Annotated[
+        str, StringConstraints(min_length=1, max_length=64)
+    ] = Field(description='公司名稱，例如 "贵州茅台"')
+    stock_code: Annotated[
+        str, StringConstraints(min_length=1, max_length=10)
+    ] = Field(description='股票代碼，例如 "600519"')
+    start_date: str = Field(description='開始日期，格式 YYYY-MM-DD')
+    end_date: str = Field(description='結束日期，格式 YYYY-MM-DD')
+    news_pages: Optional[int] = Field(
+        default=3, description='每月爬取的新聞頁數')
@@ -0,0 +1,98 @@
+"""Interactive entry point for extracting annual-report PDFs."""
+
+import logging
+import os
+import sys
+
+from pdf_extractor import TableExtractor, TextExtractor
+from pdf_extractor.utils import parse_page_ranges
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+
+def list_pdf_files(directory='.'):
+    """Return the PDF files in ``directory``, sorted by name."""
+    return sorted(
+        f for f in os.listdir(directory) if f.lower().endswith('.pdf'))
+
+
+def get_pdf_file():
+    """Prompt until the user picks an existing PDF file."""
+    pdfs = list_pdf_files()
+    # Retry loops instead of recursive re-calls: repeated bad input
+    # should not grow the call stack.
+    while True:
+        if pdfs:
+            print('\n找到以下 PDF 檔案:')
+            for i, name in enumerate(pdfs, 1):
+                print(f'  {i}. {name}')
+            choice = input('請選擇編號，或直接輸入 PDF 路徑: ').strip()
+        else:
+            choice = input('請輸入 PDF 路徑: ').strip()
+        if choice.isdigit() and pdfs and 1 <= int(choice) <= len(pdfs):
+            return pdfs[int(choice) - 1]
+        if choice and os.path.isfile(choice):
+            return choice
+        print('無效的選擇，請重新輸入。')
+
+
+def get_extraction_options():
+    """Prompt for what to extract; returns a set of option keys."""
+    options = {'1': 'tables', '2': 'text', '3': 'all'}
+    while True:
+        print('\n請選擇提取內容:')
+        print('  1. 表格')
+        print('  2. 文字')
+        print('  3. 全部')
+        choice = input('選項: ').strip()
+        selected = options.get(choice)
+        if selected is None:
+            print('無效的選項，請重新輸入。')
+            continue
+        if selected == 'all':
+            return {'tables', 'text'}
+        return {selected}
+
+
+def get_page_range():
+    """Prompt for a page range; returns a set of pages or ``None`` for all."""
+    while True:
+        raw = input('\n頁碼範圍（例如 1-3,7，留空表示全部）: ').strip()
+        if not raw:
+            return None
+        try:
+            return parse_page_ranges(raw)
+        except ValueError:
+            print('無法解析頁碼範圍，請重新輸入。')
+
+
+def get_output_dir():
+    """Prompt for the output directory (default ``output``)."""
+    raw = input('\n輸出目錄（留空使用 output）: ').strip()
+    return raw or 'output'
+
+
+def main():
+    pdf_path = get_pdf_file()
+    options = get_extraction_options()
+    pages = get_page_range()
+    output_dir = get_output_dir()
+
+    page_list = sorted(pages) if pages else None
+    if 'tables' in options:
+        TableExtractor(output_dir=output_dir).extract_tables(
+            pdf_path, pages=page_list)
+    if 'text' in options:
+        TextExtractor(output_dir=output_dir).extract_text(
+            pdf_path, pages=page_list)
+    print('\n提取完成。')
+
+
+if __name__ == '__main__':
+    try:
+        main()
+    except KeyboardInterrupt:
+        print('\n已取消。')
+        sys.exit(1)
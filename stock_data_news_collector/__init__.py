@@ -0,0 +1 @@
+"""Stock-data and news collection package for the QA pipeline."""
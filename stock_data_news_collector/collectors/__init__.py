@@ -0,0 +1,16 @@
+"""Collectors for stock market data and financial news."""
+
+__all__ = ['StockDataCollector', 'NewsCrawler']
+
+
+# PEP 562 lazy exports: importing the package stays cheap, and the
+# heavy dependency stacks (akshare/pandas for stock data, selenium for
+# news) are only pulled in when the matching collector is first used.
+def __getattr__(name):
+    if name == 'StockDataCollector':
+        from .stock_data_collector import StockDataCollector
+        return StockDataCollector
+    if name == 'NewsCrawler':
+        from .news_crawler import NewsCrawler
+        return NewsCrawler
+    raise AttributeError(name)
@@ -0,0 +1,980 @@
+"""Crawl company news from the 同花順 iWenCai search pages.
+
+The crawler walks a date range month by month, queries iWenCai for news
+about one company per month, and extracts title/time/source rows from
+the result pages. The happy path fetches the pages over plain HTTP with
+a shared async client; a headless Edge browser is only started when the
+HTTP path cannot produce results (missing deps or JS-only rendering).
+"""
+
+import asyncio
+import atexit
+import functools
+import logging
+import multiprocessing
+import os
+import queue
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import quote
+
+import numpy as np
+import pandas as pd
+
+from ..utils import ensure_directory_exists
+
+# Selenium is only needed on the last-resort fallback path, yet its
+# import costs hundreds of milliseconds. It is loaded on first browser
+# use so HTTP-only runs (and callers that just want the date helpers)
+# never pay for it.
+By = EC = Options = TimeoutException = WebDriverWait = webdriver = None
+
+
+def _load_selenium():
+    global webdriver, By, Options, WebDriverWait, EC, TimeoutException
+    if webdriver is None:
+        from selenium import webdriver
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.edge.options import Options
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
+# The pages are ordinary HTTP+HTML; a browser is only needed when the
+# endpoint insists on JS. httpx reuses one HTTP/2 connection across all
+# monthly requests, and selectolax turns the response into the same
+# visible-text form the Selenium path reads from the DOM.
+try:
+    import httpx
+    _HTTPX_AVAILABLE = True
+except ImportError:
+    _HTTPX_AVAILABLE = False
+
+try:
+    from selectolax.parser import HTMLParser
+    _SELECTOLAX_AVAILABLE = True
+except ImportError:
+    _SELECTOLAX_AVAILABLE = False
+
+# When JS rendering is required, Playwright beats a per-instance Edge
+# process: one browser lives for the crawler's lifetime, each month gets
+# a throwaway context, and a route handler stops images/styles/fonts
+# from ever being fetched.
+try:
+    from playwright.sync_api import sync_playwright
+    _PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    _PLAYWRIGHT_AVAILABLE = False
+
+_BLOCKED_RESOURCE_TYPES = frozenset(
+    ('image', 'stylesheet', 'font', 'media'))
+
+USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+              'AppleWebKit/537.36 (KHTML, like Gecko) '
+              'Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0')
+
+# Compiled once at import: the extractors run per result line, and the
+# date alternation turns five scans of each line into one.
+_TIME_ANY = re.compile('|'.join((
+    r'\d{4}-\d{2}-\d{2}',
+    r'\d{4}\.\d{2}\.\d{2}',
+    r'\d{4}/\d{2}/\d{2}',
+    r'\d{2}-\d{2} \d{2}:\d{2}',
+    r'\d{4}年\d{1,2}月\d{1,2}日',
+)))
+# An explicit 来源/出处 label wins over the bare publication-suffix
+# guess, so the two priority classes stay separate scans.
+_SOURCE_LABEL_RE = re.compile(r'(?:来源|出处)[:：]\s*(\S+)')
+_SOURCE_SUFFIX_RE = re.compile(r'(\S+?(?:财经|证券|日报|新闻|网))')
+
+# iWenCai renders news as structured result cards; pulling the cards
+# with one query beats serializing the whole body text and re-scanning
+# it line by line. The body-text parser stays as the fallback when the
+# markup changes.
+_ITEM_SELECTOR = 'div.result-item, .search-result'
+_TITLE_SELECTOR = '.title'
+_ITEM_TIME_SELECTOR = '.time'
+_ITEM_SOURCE_SELECTOR = '.source'
+
+# One script call scans the DOM in the browser process and answers both
+# page probes; the per-probe find_element round-trips stay as fallback.
+# The rendered result page itself loads its news list from this XHR
+# endpoint; hitting it directly returns JSON rows with no render and no
+# text scraping. The HTML scrape stays as fallback when the endpoint
+# rejects the request (auth token, schema change).
+_JSON_ENDPOINT = 'https://www.iwencai.com/gateway/urp/v7/landing/getDataList'
+
+_PAGE_STATE_JS = (
+    'const t = document.body.innerText;'
+    'const noData = /抱歉.*没有找到|暂无数据|没有相关结果|No results/.test(t);'
+    "const next = !!document.querySelector("
+    "'a.next, a.pagination-next, a[class*=next]');"
+    'return [noData, next];')
+
+
+# Low-cardinality columns: one value per crawl (Company), a handful of
+# outlets (Source), one value per month (TimeRange) and small ints
+# (Page). Category codes store each distinct value once instead of one
+# Python string object per row.
+_CATEGORY_COLUMNS = ('Company', 'Source', 'TimeRange', 'Page')
+
+
+def _node_text(node, selector):
+    """First-match text under a selectolax node, or ''."""
+    found = node.css_first(selector)
+    return found.text(strip=True) if found is not None else ''
+
+
+@functools.lru_cache(maxsize=32)
+def _company_line_re(company_name):
+    """Multiline pattern matching whole lines that mention the company."""
+    return re.compile(rf'(?m)^.*{re.escape(company_name)}.*$')
+
+
+def _categorize(df):
+    for column in _CATEGORY_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+    return df
+
+
+# Cells containing any of these need CSV quoting and force the slow
+# writer; everything else can be joined with bare commas.
+_CSV_QUOTE_RE = re.compile(r'[,"\r\n]')
+
+
+def _write_csv_fast(df, f):
+    """Format ``df`` as CSV in one vectorized pass when no cell needs
+    quoting.
+
+    Returns ``False`` without writing anything when quoting is needed,
+    so the caller can fall back to ``to_csv``.
+    """
+    cells = df.astype(str).where(df.notna(), '')
+    for column in cells.columns:
+        if cells[column].str.contains(_CSV_QUOTE_RE, regex=True).any():
+            return False
+    row_fmt = ','.join(['{}'] * len(cells.columns)) + '\n'
+    f.write(','.join(map(str, df.columns)) + '\n')
+    f.writelines(row_fmt.format(*row) for row in cells.to_numpy())
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _worker_crawler(output_dir, visible):
+    """One lazily built crawler per worker process, closed at exit."""
+    crawler = NewsCrawler(output_dir=output_dir, visible=visible)
+    atexit.register(crawler.close)
+    return crawler
+
+
+def _crawl_month(output_dir, visible, company_name, start_date, end_date,
+                 pages_per_month):
+    """Pool target: crawl one month on this worker's own browser."""
+    # A small per-worker jitter replaces the fixed inter-month sleep so
+    # the workers do not hammer the site in lockstep.
+    time.sleep(random.uniform(0.5, 2.0))
+    crawler = _worker_crawler(output_dir, visible)
+    return crawler.crawl_single_month(company_name, start_date, end_date,
+                                      pages_per_month)
+
+
+def _crawl_month_star(args):
+    return _crawl_month(*args)
+
+
+class NewsCrawler:
+    """Collect per-month company news rows into DataFrames."""
+
+    # Hot Edge browsers shared across crawler instances: close() parks
+    # the driver here instead of quitting, so the next crawler skips
+    # the multi-second browser startup. Drivers that have served too
+    # many pages are quit rather than parked, bounding memory growth.
+    _driver_pool = queue.Queue()
+    _DRIVER_PAGE_LIMIT = 50
+    # Class-wide: pip installing playwright does not install the
+    # browser binaries (`playwright install` is a separate step), so a
+    # failed launch is remembered and later months skip straight to
+    # the pooled Selenium path.
+    _playwright_broken = False
+
+    def __init__(self, output_dir='news_data', visible=False,
+                 save_format='feather', save_chunksize=50_000):
+        self.output_dir = output_dir
+        self.visible = visible
+        # 'feather' (default), 'parquet' or 'csv'; columnar formats
+        # write an order of magnitude faster and re-read faster too.
+        self.save_format = save_format
+        # Rows per CSV write slice; bounds the intermediate buffer
+        # to_csv builds instead of materialising the whole file.
+        self.save_chunksize = save_chunksize
+        self.logger = logging.getLogger(__name__)
+        # The browser is expensive to start, so it is created on first
+        # Selenium use rather than here; HTTP-only runs never pay for it.
+        self.driver = None
+        self.wait = None
+        self._driver_pages = 0
+        self._pw = None
+        self._browser = None
+        # (title, time) pairs already emitted; duplicates are dropped
+        # as rows are built instead of by a whole-frame dedup pass.
+        self._seen = set()
+        # Directories this crawler already created; repeated saves skip
+        # the stat+makedirs filesystem round-trip.
+        self._dirs_created = set()
+        # None until probed; True/False once the JSON endpoint has
+        # answered or refused, so one failure stops further attempts.
+        self._json_supported = None
+
+    # ------------------------------------------------------------------
+    # Driver lifecycle
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _new_driver(visible):
+        """Start one headless Edge browser."""
+        _load_selenium()
+        options = Options()
+        if not visible:
+            options.add_argument('--headless')
+        options.add_argument('--disable-gpu')
+        options.add_argument('--no-sandbox')
+        options.add_argument(f'--user-agent={USER_AGENT}')
+        return webdriver.Edge(options=options)
+
+    def setup_driver(self):
+        """Start the headless Edge browser used as the JS fallback."""
+        if self.driver is not None:
+            return
+        _load_selenium()
+        try:
+            self.driver, self._driver_pages = \
+                NewsCrawler._driver_pool.get_nowait()
+        except queue.Empty:
+            self.driver = self._new_driver(self.visible)
+            self._driver_pages = 0
+        self.wait = WebDriverWait(self.driver, 20)
+
+    @classmethod
+    def prewarm_pool(cls, count, visible=False):
+        """Start ``count`` browsers up front, overlapping their startup.
+
+        Browser startup costs seconds each; warming the pool before a
+        fan-out means no crawl worker blocks on it later.
+        """
+        with ThreadPoolExecutor(max_workers=count) as pool:
+            for driver in pool.map(
+                    lambda _: cls._new_driver(visible), range(count)):
+                cls._driver_pool.put((driver, 0))
+
+    def _ensure_browser(self):
+        """Launch the shared Playwright browser on first use."""
+        if self._browser is None:
+            self._pw = sync_playwright().start()
+            try:
+                self._browser = self._pw.chromium.launch(
+                    headless=not self.visible)
+            except Exception:
+                self._pw.stop()
+                self._pw = None
+                raise
+        return self._browser
+
+    def close(self):
+        """Release the browsers; the Edge driver is pooled, not quit."""
+        if self.driver is not None:
+            if self._driver_pages >= self._DRIVER_PAGE_LIMIT:
+                self.driver.quit()
+            else:
+                NewsCrawler._driver_pool.put(
+                    (self.driver, self._driver_pages))
+            self.driver = None
+            self.wait = None
+        if self._browser is not None:
+            self._browser.close()
+            self._pw.stop()
+            self._browser = None
+            self._pw = None
+
+    @classmethod
+    def shutdown_pool(cls):
+        """Quit every parked browser; call once at end of program."""
+        drivers = []
+        while True:
+            try:
+                drivers.append(cls._driver_pool.get_nowait()[0])
+            except queue.Empty:
+                break
+        if not drivers:
+            return
+        # quit() blocks until the browser is gone; overlap the waits.
+        with ThreadPoolExecutor(max_workers=len(drivers)) as pool:
+            for _ in pool.map(lambda d: d.quit(), drivers):
+                pass
+
+    # ------------------------------------------------------------------
+    # Date helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def validate_dates(start_date, end_date):
+        """Check ``YYYY-MM-DD`` format and ordering; raise ``ValueError``."""
+        # fromisoformat is the C-level parser, ~10x faster than the
+        # format-string interpreter in strptime.
+        start = datetime.fromisoformat(start_date)
+        end = datetime.fromisoformat(end_date)
+        if start > end:
+            raise ValueError('start_date must not be after end_date')
+        return start, end
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def generate_monthly_ranges(start_date, end_date):
+        """Split ``[start_date, end_date]`` into per-month (start, end) pairs.
+
+        Built in one date_range call rather than a month-by-month walk,
+        and memoized: every company crawled over the same span reuses
+        the same list.
+        """
+        NewsCrawler.validate_dates(start_date, end_date)
+        start = pd.Timestamp(start_date)
+        end = pd.Timestamp(end_date)
+        starts = pd.date_range(start_date, end_date,
+                               freq='MS').union([start])
+        ends = starts + pd.offsets.MonthEnd(0)
+        ends = ends.where(ends <= end, end)
+        return list(zip(starts.strftime('%Y-%m-%d'),
+                        ends.strftime('%Y-%m-%d')))
+
+    def construct_base_url(self, company_name, start_date, end_date):
+        """Build the iWenCai news-search URL for one month."""
+        query = f'{start_date}至{end_date}{company_name}新闻'
+        return ('https://www.iwencai.com/unifiedwap/result?w='
+                f'{quote(query)}&querytype=info')
+
+    # ------------------------------------------------------------------
+    # HTTP fast path
+    # ------------------------------------------------------------------
+
+    async def _fetch_page_json(self, client, company_name, start_date,
+                               end_date, page_number):
+        query = f'{start_date}至{end_date}{company_name}新闻'
+        resp = await client.post(
+            _JSON_ENDPOINT,
+            json={'query': query, 'page': page_number, 'perpage': 50,
+                  'query_type': 'info'})
+        resp.raise_for_status()
+        return resp.json()['data']['result']
+
+    def _rows_from_json(self, rows, company_name, time_range, page_number):
+        """Build the news DataFrame straight from the XHR records."""
+        df = pd.DataFrame.from_records(rows)
+        if df.empty:
+            return None
+
+        def col(*names):
+            for name in names:
+                if name in df.columns:
+                    return df[name].astype(str)
+            return pd.Series('', index=df.index, dtype=object)
+
+        titles = col('title')
+        times = col('publish_time', 'time', 'date')
+        seen = self._seen
+        keep = np.empty(len(df), dtype=bool)
+        for i, key in enumerate(zip(titles, times)):
+            if key in seen:
+                keep[i] = False
+            else:
+                seen.add(key)
+                keep[i] = True
+        out = pd.DataFrame({
+            'Title': titles,
+            'Link': col('url', 'link'),
+            'Source': col('source', 'media'),
+            'Time': times,
+            'Summary': col('summary', 'content', 'digest').str.slice(0, 200),
+            'Company': company_name,
+            'TimeRange': time_range,
+            'Page': page_number,
+            'CrawlTime': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        })
+        if not keep.all():
+            out = out[keep].reset_index(drop=True)
+        if out.empty:
+            return None
+        return _categorize(out)
+
+    async def _crawl_single_month_http(self, client, company_name,
+                                       start_date, end_date,
+                                       pages_per_month):
+        base_url = self.construct_base_url(company_name, start_date, end_date)
+        time_range = f'{start_date}至{end_date}'
+        frames = []
+        for page_number in range(1, pages_per_month + 1):
+            df = None
+            if self._json_supported is not False:
+                try:
+                    rows = await self._fetch_page_json(
+                        client, company_name, start_date, end_date,
+                        page_number)
+                except Exception as exc:
+                    if self._json_supported is None:
+                        self.logger.info(
+                            'JSON endpoint unavailable (%s); scraping HTML',
+                            exc)
+                    self._json_supported = False
+                else:
+                    self._json_supported = True
+                    if not rows:
+                        break
+                    df = self._rows_from_json(rows, company_name,
+                                              time_range, page_number)
+            if self._json_supported is False:
+                resp = await client.get(f'{base_url}&pg={page_number}')
+                resp.raise_for_status()
+                html = resp.text
+                tree = HTMLParser(html)
+                items = tree.css(_ITEM_SELECTOR)
+                if items:
+                    entries = [(
+                        _node_text(item, _TITLE_SELECTOR),
+                        _node_text(item, _ITEM_TIME_SELECTOR),
+                        _node_text(item, _ITEM_SOURCE_SELECTOR),
+                        item.text(separator='\n'))
+                        for item in items]
+                    df = self._rows_from_entries(
+                        entries, company_name, time_range, page_number,
+                        str(resp.url))
+                else:
+                    body = tree.body
+                    body_text = (body.text(separator='\n')
+                                 if body is not None else '')
+                    if '抱歉' in body_text or '暂无数据' in body_text:
+                        break
+                    if len(html) < 5120:
+                        # A tiny shell with no result cards means the
+                        # page is JS-rendered; let the caller fall back
+                        # to the browser path instead of returning an
+                        # empty month.
+                        raise RuntimeError(
+                            'result page appears JS-rendered')
+                    df = self._parse_body_text(body_text, company_name,
+                                               time_range, page_number,
+                                               str(resp.url))
+            if df is None or df.empty:
+                break
+            frames.append(df)
+        return self._write_month_partition(frames, company_name, start_date)
+
+    async def _crawl_months_http(self, company_name, monthly_ranges,
+                                 pages_per_month, max_workers=None):
+        limits = httpx.Limits(max_keepalive_connections=10)
+        semaphore = asyncio.Semaphore(max_workers or 8)
+
+        async def bounded(client, month_start, month_end):
+            async with semaphore:
+                return await self._crawl_single_month_http(
+                    client, company_name, month_start, month_end,
+                    pages_per_month)
+
+        async with httpx.AsyncClient(
+                http2=True, headers={'User-Agent': USER_AGENT},
+                limits=limits, timeout=20.0,
+                follow_redirects=True) as client:
+            counts = await asyncio.gather(*[
+                bounded(client, month_start, month_end)
+                for month_start, month_end in monthly_ranges])
+        return sum(counts)
+
+    # ------------------------------------------------------------------
+    # Month partitions
+    # ------------------------------------------------------------------
+
+    def _ensure_dir(self, directory):
+        if directory not in self._dirs_created:
+            ensure_directory_exists(directory)
+            self._dirs_created.add(directory)
+
+    def _month_partition_dir(self, company_name):
+        return os.path.join(self.output_dir, 'news',
+                            f'{company_name}_parts')
+
+    def _write_month_partition(self, frames, company_name, month_start):
+        """Concat one month's pages and write its parquet partition.
+
+        Each month is flushed to disk as soon as it finishes, so memory
+        stays flat no matter how long the crawled range is; the range
+        crawler reads the partitioned dataset back in one go at the end.
+        Returns the number of rows written.
+        """
+        if not frames:
+            return 0
+        if len(frames) == 1:
+            df = frames[0]
+        else:
+            df = pd.concat(frames, ignore_index=True, copy=False)
+        part_dir = self._month_partition_dir(company_name)
+        self._ensure_dir(part_dir)
+        df.to_parquet(
+            os.path.join(part_dir, f'month={month_start}.parquet'),
+            compression='zstd')
+        return len(df)
+
+    # ------------------------------------------------------------------
+    # Selenium fallback path
+    # ------------------------------------------------------------------
+
+    def _crawl_single_month_playwright(self, company_name, start_date,
+                                       end_date, pages_per_month):
+        """Crawl one month with a fresh context on the shared browser."""
+        browser = self._ensure_browser()
+        base_url = self.construct_base_url(company_name, start_date, end_date)
+        time_range = f'{start_date}至{end_date}'
+        all_news_data = []
+        ctx = browser.new_context(user_agent=USER_AGENT)
+        try:
+            ctx.route('**/*', lambda route: route.abort()
+                      if route.request.resource_type in
+                      _BLOCKED_RESOURCE_TYPES else route.continue_())
+            page = ctx.new_page()
+            for page_number in range(1, pages_per_month + 1):
+                page_url = f'{base_url}&pg={page_number}'
+                self.logger.info('Crawling %s page %d', time_range,
+                                 page_number)
+                try:
+                    page.goto(page_url, wait_until='domcontentloaded',
+                              timeout=20000)
+                except Exception as exc:
+                    self.logger.warning('Failed to load %s: %s',
+                                        page_url, exc)
+                    break
+                items = page.query_selector_all(_ITEM_SELECTOR)
+                if items:
+                    entries = []
+                    for item in items:
+                        text = item.inner_text()
+                        title_el = item.query_selector(_TITLE_SELECTOR)
+                        time_el = item.query_selector(_ITEM_TIME_SELECTOR)
+                        source_el = item.query_selector(
+                            _ITEM_SOURCE_SELECTOR)
+                        entries.append((
+                            title_el.inner_text() if title_el else None,
+                            time_el.inner_text() if time_el else None,
+                            source_el.inner_text() if source_el else None,
+                            text))
+                    df = self._rows_from_entries(
+                        entries, company_name, time_range, page_number,
+                        page.url)
+                else:
+                    body_text = page.inner_text('body')
+                    if '抱歉' in body_text or '暂无数据' in body_text:
+                        self.logger.info('No data for %s', time_range)
+                        break
+                    df = self._parse_body_text(body_text, company_name,
+                                               time_range, page_number,
+                                               page.url)
+                if df is not None and not df.empty:
+                    all_news_data.append(df)
+                if page.query_selector(
+                        'a.next, a.pagination-next, a[class*=next]') is None:
+                    break
+        finally:
+            # Only the per-month context is torn down; the browser
+            # stays hot for the next month.
+            ctx.close()
+        return all_news_data
+
+    def crawl_single_month(self, company_name, start_date, end_date,
+                           pages_per_month=3):
+        """Crawl one month's result pages; returns per-page DataFrames.
+
+        The list is concatenated exactly once by the caller, so a month
+        never pays its own intermediate concat.
+        """
+        if _PLAYWRIGHT_AVAILABLE and not NewsCrawler._playwright_broken:
+            try:
+                self._ensure_browser()
+            except Exception as exc:
+                NewsCrawler._playwright_broken = True
+                self.logger.warning(
+                    'Playwright browser unavailable (%s); using Selenium',
+                    exc)
+            else:
+                return self._crawl_single_month_playwright(
+                    company_name, start_date, end_date, pages_per_month)
+        self.setup_driver()
+        base_url = self.construct_base_url(company_name, start_date, end_date)
+        time_range = f'{start_date}至{end_date}'
+        all_news_data = []
+        for page_number in range(1, pages_per_month + 1):
+            page_url = f'{base_url}&pg={page_number}'
+            self.logger.info('Crawling %s page %d', time_range, page_number)
+            try:
+                self.driver.get(page_url)
+            except Exception as exc:
+                self.logger.warning('Failed to load %s: %s', page_url, exc)
+                break
+            self._driver_pages += 1
+            # Wait for either real results or the empty-result marker:
+            # fast pages proceed immediately, slow ones get the full
+            # 20s the old fixed sleeps never offered.
+            try:
+                self.wait.until(EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, f'{_ITEM_SELECTOR}, .no-data')))
+            except TimeoutException:
+                self.logger.warning('Timed out waiting for %s', page_url)
+                continue
+            no_data, has_next = self._page_state()
+            if no_data:
+                self.logger.info('No data for %s', time_range)
+                break
+            df = self.extract_news_data(company_name, time_range, page_number)
+            if df is not None and not df.empty:
+                all_news_data.append(df)
+            if not has_next:
+                break
+        return all_news_data
+
+    def crawl_news_by_monthly_ranges(self, company_name, start_date,
+                                     end_date, pages_per_month=3,
+                                     max_workers=None):
+        """Crawl the whole range month by month and save the result.
+
+        ``max_workers`` caps how many months are crawled concurrently;
+        when ``None`` the cap is picked per backend.
+        """
+        monthly_ranges = self.generate_monthly_ranges(start_date, end_date)
+        self._seen.clear()
+
+        # Partitions persist across runs; without this, a previous
+        # crawl of the same company over a different window would be
+        # merged into this run's result by the read-back below.
+        part_dir = self._month_partition_dir(company_name)
+        if os.path.isdir(part_dir):
+            for name in os.listdir(part_dir):
+                os.unlink(os.path.join(part_dir, name))
+
+        # None means the HTTP fast path failed or is unavailable; 0
+        # means it ran and there is genuinely no news, which must not
+        # trigger a browser re-crawl of months already known empty.
+        rows_written = None
+        if _HTTPX_AVAILABLE and _SELECTOLAX_AVAILABLE:
+            try:
+                rows_written = asyncio.run(self._crawl_months_http(
+                    company_name, monthly_ranges, pages_per_month,
+                    max_workers))
+            except Exception as exc:
+                self.logger.warning(
+                    'HTTP fast path failed (%s); falling back to browser',
+                    exc)
+                rows_written = None
+
+        if rows_written is None:
+            rows_written = 0
+            # A partially-successful HTTP attempt has already keyed its
+            # rows; without a reset the fallback's rows dedup against
+            # them and whole months come back empty.
+            self._seen.clear()
+            # Months are independent, but a browser cannot be shared
+            # across threads -- so each pool worker owns a full crawler
+            # and the months overlap their render time across processes.
+            if len(monthly_ranges) > 1:
+                args = [(self.output_dir, self.visible, company_name,
+                         month_start, month_end, pages_per_month)
+                        for month_start, month_end in monthly_ranges]
+                processes = min(max_workers or 4, len(monthly_ranges))
+                with multiprocessing.Pool(processes=processes) as pool:
+                    # imap streams results back one month at a time, so
+                    # each month is flushed to its partition and freed
+                    # before the next one arrives.
+                    for (month_start, _), frames in zip(
+                            monthly_ranges,
+                            pool.imap(_crawl_month_star, args)):
+                        rows_written += self._write_month_partition(
+                            frames, company_name, month_start)
+            else:
+                for month_start, month_end in monthly_ranges:
+                    frames = self.crawl_single_month(
+                        company_name, month_start, month_end,
+                        pages_per_month)
+                    rows_written += self._write_month_partition(
+                        frames, company_name, month_start)
+
+        if not rows_written:
+            self.logger.warning('No news collected for %s', company_name)
+            return None
+
+        # Re-cast after the dataset read: partitions written with
+        # differing category sets come back as object columns. The
+        # dedup covers the pool fallback, whose workers each hold
+        # their own _seen set and so can re-emit cross-month repeats.
+        combined_data = _categorize(
+            pd.read_parquet(
+                self._month_partition_dir(company_name), engine='pyarrow')
+            .drop_duplicates(subset=['Title', 'Time'], ignore_index=True))
+        self.save_news_data(combined_data, company_name)
+        return combined_data
+
+    # ------------------------------------------------------------------
+    # Page parsing
+    # ------------------------------------------------------------------
+
+    def extract_news_data(self, company_name, time_range, page_number):
+        """Pull news rows out of the currently loaded result page."""
+        try:
+            items = self.driver.find_elements(By.CSS_SELECTOR,
+                                              _ITEM_SELECTOR)
+        except Exception:
+            items = []
+        if items:
+            entries = []
+            for item in items:
+                text = item.text
+                entries.append((
+                    self._item_field(item, _TITLE_SELECTOR),
+                    self._item_field(item, _ITEM_TIME_SELECTOR),
+                    self._item_field(item, _ITEM_SOURCE_SELECTOR),
+                    text))
+            return self._rows_from_entries(
+                entries, company_name, time_range, page_number,
+                self.driver.current_url)
+        # The results container is an order of magnitude smaller than
+        # the whole body (no header/nav/footer), so serialize only it
+        # over the wire; the full body remains the last resort.
+        try:
+            container = self.driver.find_element(
+                By.CSS_SELECTOR, 'div.result-list, #result-list')
+            body_text = container.get_attribute('innerText')
+        except Exception:
+            try:
+                body_text = self.driver.find_element(
+                    By.TAG_NAME, 'body').text
+            except Exception as exc:
+                self.logger.warning('Could not read page body: %s', exc)
+                return None
+        return self._parse_body_text(body_text, company_name, time_range,
+                                     page_number, self.driver.current_url)
+
+    @staticmethod
+    def _item_field(item, selector):
+        try:
+            return item.find_element(By.CSS_SELECTOR, selector).text
+        except Exception:
+            return None
+
+    def _rows_from_entries(self, entries, company_name, time_range,
+                           page_number, current_url):
+        """Build the news DataFrame from (title, time, source, text) cards.
+
+        Card fields missing from the markup fall back to the regex
+        helpers over the card's own text, never the whole page.
+        """
+        titles, times, sources, summaries = [], [], [], []
+        seen = self._seen
+        for title, news_time, source, text in entries:
+            if title is None:
+                title = self.extract_title_from_text(
+                    text.split('\n', 1)[0], company_name)
+            if news_time is None:
+                news_time = self.extract_time_from_text(text)
+            key = (title, news_time)
+            if key in seen:
+                continue
+            seen.add(key)
+            titles.append(title)
+            times.append(news_time)
+            sources.append(source if source is not None
+                           else self.extract_source_from_text(text))
+            summaries.append(text[:200])
+        if not titles:
+            return None
+        crawl_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        return _categorize(pd.DataFrame({
+            'Title': titles,
+            'Link': current_url,
+            'Source': sources,
+            'Time': times,
+            'Summary': summaries,
+            'Company': company_name,
+            'TimeRange': time_range,
+            'Page': page_number,
+            'CrawlTime': crawl_time,
+        }))
+
+    def _parse_body_text(self, body_text, company_name, time_range,
+                         page_number, current_url):
+        """Turn the visible page text into a DataFrame of news rows."""
+        # One C-level multiline scan pulls only the lines mentioning
+        # the company; Python then just strips and length-checks those
+        # few matches instead of iterating every line of the page.
+        company_lines = []
+        for line in _company_line_re(company_name).findall(body_text):
+            line = line.strip()
+            if len(line) > 20:
+                company_lines.append(line)
+                if len(company_lines) == 50:
+                    break
+        if not company_lines:
+            return None
+
+        # One C-level pass per field over the whole column instead of
+        # three regex scans and slicing branches per line.
+        lines = pd.Series(company_lines, dtype=object)
+        times = lines.str.extract(
+            f'({_TIME_ANY.pattern})', expand=False).fillna('')
+        sources = lines.str.extract(
+            _SOURCE_LABEL_RE.pattern, expand=False)
+        sources = sources.fillna(lines.str.extract(
+            _SOURCE_SUFFIX_RE.pattern, expand=False)).fillna('')
+
+        # Every kept line contains the company name, so "slice from the
+        # company name onwards" covers the startswith case too: the
+        # partition separator plus its tail is exactly text[idx:].
+        titles = (company_name + lines.str.partition(company_name)[2])
+        titles = titles.str.slice(0, 150)
+        titles = titles.where(titles.str.len() <= 100,
+                              titles.str.slice(0, 100) + '...')
+
+        seen = self._seen
+        keep = np.empty(len(lines), dtype=bool)
+        for i, key in enumerate(zip(titles, times)):
+            if key in seen:
+                keep[i] = False
+            else:
+                seen.add(key)
+                keep[i] = True
+
+        crawl_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        df = pd.DataFrame({
+            'Title': titles,
+            'Link': current_url,
+            'Source': sources,
+            'Time': times,
+            'Summary': lines.str.slice(0, 200),
+            'Company': company_name,
+            'TimeRange': time_range,
+            'Page': page_number,
+            'CrawlTime': crawl_time,
+        })
+        if not keep.all():
+            df = df[keep].reset_index(drop=True)
+        if df.empty:
+            return None
+        return _categorize(df)
+
+    def extract_time_from_text(self, text):
+        """Find the first date-like token in ``text``."""
+        m = _TIME_ANY.search(text)
+        return m.group(0) if m else ''
+
+    def extract_title_from_text(self, text, company_name):
+        """Derive a short title from one result line."""
+        if text.startswith(company_name):
+            title = text[:150]
+        elif company_name in text:
+            idx = text.find(company_name)
+            title = text[idx:idx + 150]
+        else:
+            title = text[:100]
+        if len(title) > 100:
+            title = title[:100] + '...'
+        return title
+
+    def extract_source_from_text(self, text):
+        """Find a news-source token like ``来源:新浪财经`` in ``text``."""
+        m = _SOURCE_LABEL_RE.search(text)
+        if m is None:
+            m = _SOURCE_SUFFIX_RE.search(text)
+        return m.group(1) if m else ''
+
+    # ------------------------------------------------------------------
+    # Page-state probes (Selenium path)
+    # ------------------------------------------------------------------
+
+    def _page_state(self):
+        """Return ``(no_data, has_next)`` for the current page in one RPC."""
+        try:
+            no_data, has_next = self.driver.execute_script(_PAGE_STATE_JS)
+            return bool(no_data), bool(has_next)
+        except Exception:
+            return self.check_no_data_page(), self.has_next_page_simple()
+
+    def check_no_data_page(self):
+        """True when the current page reports an empty result set."""
+        markers = [
+            "//*[contains(text(), '抱歉，没有找到')]",
+            "//*[contains(text(), '暂无数据')]",
+            "//*[contains(text(), '没有相关结果')]",
+            "//*[contains(text(), 'No results')]",
+        ]
+        for xpath in markers:
+            try:
+                if self.driver.find_elements(By.XPATH, xpath):
+                    return True
+            except Exception:
+                continue
+        return False
+
+    def has_next_page_simple(self):
+        """True when the current page exposes a next-page link."""
+        selectors = ['a.next', 'a.pagination-next', "a[class*='next']"]
+        for selector in selectors:
+            try:
+                if self.driver.find_elements(By.CSS_SELECTOR, selector):
+                    return True
+            except Exception:
+                continue
+        return False
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def save_news_data(self, df, company_name):
+        """Write the combined news rows to one file per company.
+
+        The format follows ``self.save_format``; CSV stays available
+        for consumers that open the file in Excel.
+        """
+        news_dir = os.path.join(self.output_dir, 'news')
+        self._ensure_dir(news_dir)
+        base = os.path.join(news_dir, f'{company_name}_news')
+        if self.save_format == 'feather':
+            output_file = base + '.feather'
+            df.reset_index(drop=True).to_feather(
+                output_file, compression='zstd')
+        elif self.save_format == 'parquet':
+            output_file = base + '.parquet'
+            df.to_parquet(output_file, compression='zstd')
+        else:
+            output_file = base + '.csv'
+            # A wide buffer lets the row chunks coalesce into few large
+            # write() syscalls instead of one per default-sized block.
+            with open(output_file, 'w', buffering=1 << 20, newline='',
+                      encoding='utf-8-sig') as f:
+                if not _write_csv_fast(df, f):
+                    # One handle, sliced writes: peak memory stays at
+                    # one chunk's worth of formatted text.
+                    step = self.save_chunksize
+                    for i in range(0, len(df), step):
+                        df.iloc[i:i + step].to_csv(
+                            f, index=False, header=(i == 0))
+        self.logger.info('Saved %d news rows to %s', len(df), output_file)
+        return output_file
+
+    def take_screenshot(self, name):
+        """Save a debug screenshot of the current browser page."""
+        if self.driver is None:
+            return None
+        shot_dir = os.path.join(self.output_dir, 'screenshots')
+        self._ensure_dir(shot_dir)
+        path = os.path.join(shot_dir, f'{name}.png')
+        self.driver.save_screenshot(path)
+        return path
+
+
+atexit.register(NewsCrawler.shutdown_pool)
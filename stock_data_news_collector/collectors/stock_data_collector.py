@@ -0,0 +1,688 @@
+"""Collect A-share/HK stock data through AkShare.
+
+One collector per stock: basic info, K-line price history with
+technical indicators, financial statements and an index comparison,
+all saved under a per-stock data directory with a JSON summary report.
+"""
+
+import functools
+import json
+import logging
+import os
+import random
+import re
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import akshare as ak
+import numpy as np
+import pandas as pd
+import requests
+
+from ..utils import ensure_directory_exists
+
+try:
+    import numba
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+# Middle rung between the numba kernel and plain pandas rolling:
+# bottleneck's moving-window C kernels skip pandas' per-window
+# dispatch without any JIT warm-up cost.
+try:
+    import bottleneck as bn
+    _BOTTLENECK_AVAILABLE = True
+except ImportError:
+    _BOTTLENECK_AVAILABLE = False
+
+# orjson serializes straight to UTF-8 bytes several times faster than
+# the stdlib encoder; the reports fall back to json without it.
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# AkShare issues its HTTP through the module-level requests helpers,
+# each of which builds a throwaway Session -- a fresh TCP+TLS handshake
+# per API call. Rebinding the helpers to one Session with a sized
+# connection pool keeps sockets to sina/eastmoney/ths warm across the
+# whole collection run. Deliberately process-wide: every requests user
+# in this process shares the pool. The adapter does its own zero-retry
+# policy; retrying stays safe_akshare_call's job.
+_SESSION = requests.Session()
+_ADAPTER = requests.adapters.HTTPAdapter(
+    pool_connections=16, pool_maxsize=32, max_retries=0)
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
+requests.get = _SESSION.get
+requests.post = _SESSION.post
+
+MAX_RETRIES = 3
+RETRY_DELAY = 2
+
+# One process-wide pool shared by every collector, so a batch driver
+# collecting many tickers overlaps their network waits instead of each
+# collector spinning up (and tearing down) its own threads.
+_AKSHARE_POOL = ThreadPoolExecutor(max_workers=8,
+                                   thread_name_prefix='akshare')
+
+TECHNICAL_INDICATORS = {
+    'MA5': 5,
+    'MA10': 10,
+    'MA20': 20,
+    'MA60': 60,
+    'RSI': 14,
+    'BOLL': 20,
+}
+
+# Built once at import; the lookup methods used to rebuild these
+# literals on every call.
+_NAME_MAP = {
+    '600519': '贵州茅台',
+    '000858': '五粮液',
+    '601318': '中国平安',
+    '000001': '平安银行',
+    '600036': '招商银行',
+    '00700': '腾讯控股',
+    '09988': '阿里巴巴-SW',
+}
+
+_LISTING_DATE_MAP = {
+    '600519': '2001-08-27',
+    '000858': '1998-04-27',
+    '601318': '2007-03-01',
+    '000001': '1991-04-03',
+    '600036': '2002-04-09',
+    '00700': '2004-06-16',
+}
+
+_INDUSTRY_MAP = {
+    '600519': '白酒',
+    '000858': '白酒',
+    '601318': '保险',
+    '000001': '银行',
+    '600036': '银行',
+    '00700': '互联网',
+}
+
+
+def _compute_indicators_py(close):
+    """Fused single-pass indicator kernel over the close-price array.
+
+    One loop maintains running sums for the four MA windows, the
+    Bollinger mean/variance, the Wilder gain/loss sums for RSI and the
+    scalar EMA recurrences for MACD, so the close array is traversed
+    once instead of ~12 times. Window widths mirror
+    ``TECHNICAL_INDICATORS``; NaN prefixes match pandas rolling
+    semantics (ddof=1 for the Bollinger std).
+    """
+    n = close.shape[0]
+    ma5 = np.full(n, np.nan)
+    ma10 = np.full(n, np.nan)
+    ma20 = np.full(n, np.nan)
+    ma60 = np.full(n, np.nan)
+    rsi = np.full(n, np.nan)
+    macd = np.empty(n)
+    macd_signal = np.empty(n)
+    macd_hist = np.empty(n)
+    boll_mid = np.full(n, np.nan)
+    boll_upper = np.full(n, np.nan)
+    boll_lower = np.full(n, np.nan)
+    if n == 0:
+        return (ma5, ma10, ma20, ma60, rsi, macd, macd_signal, macd_hist,
+                boll_mid, boll_upper, boll_lower)
+
+    a12 = 2.0 / 13.0
+    a26 = 2.0 / 27.0
+    a9 = 2.0 / 10.0
+    ema12 = close[0]
+    ema26 = close[0]
+    sig = 0.0
+    sum5 = 0.0
+    sum10 = 0.0
+    sum20 = 0.0
+    sum60 = 0.0
+    boll_sum = 0.0
+    boll_sumsq = 0.0
+    gain_sum = 0.0
+    loss_sum = 0.0
+    for i in range(n):
+        x = close[i]
+        if i > 0:
+            ema12 = a12 * x + (1.0 - a12) * ema12
+            ema26 = a26 * x + (1.0 - a26) * ema26
+        m = ema12 - ema26
+        if i == 0:
+            sig = m
+        else:
+            sig = a9 * m + (1.0 - a9) * sig
+        macd[i] = m
+        macd_signal[i] = sig
+        macd_hist[i] = m - sig
+
+        sum5 += x
+        if i >= 5:
+            sum5 -= close[i - 5]
+        if i >= 4:
+            ma5[i] = sum5 / 5.0
+        sum10 += x
+        if i >= 10:
+            sum10 -= close[i - 10]
+        if i >= 9:
+            ma10[i] = sum10 / 10.0
+        sum20 += x
+        if i >= 20:
+            sum20 -= close[i - 20]
+        if i >= 19:
+            ma20[i] = sum20 / 20.0
+        sum60 += x
+        if i >= 60:
+            sum60 -= close[i - 60]
+        if i >= 59:
+            ma60[i] = sum60 / 60.0
+
+        boll_sum += x
+        boll_sumsq += x * x
+        if i >= 20:
+            y = close[i - 20]
+            boll_sum -= y
+            boll_sumsq -= y * y
+        if i >= 19:
+            mean = boll_sum / 20.0
+            var = (boll_sumsq - boll_sum * boll_sum / 20.0) / 19.0
+            if var < 0.0:
+                var = 0.0
+            std = var ** 0.5
+            boll_mid[i] = mean
+            boll_upper[i] = mean + 2.0 * std
+            boll_lower[i] = mean - 2.0 * std
+
+        if i >= 1:
+            d = x - close[i - 1]
+            gain_sum += d if d > 0.0 else 0.0
+            loss_sum += -d if d < 0.0 else 0.0
+            if i > 14:
+                d_old = close[i - 14] - close[i - 15]
+                gain_sum -= d_old if d_old > 0.0 else 0.0
+                loss_sum -= -d_old if d_old < 0.0 else 0.0
+            if i >= 14:
+                if loss_sum > 0.0:
+                    rsi[i] = 100.0 - 100.0 / (1.0 + gain_sum / loss_sum)
+                elif gain_sum > 0.0:
+                    rsi[i] = 100.0
+    return (ma5, ma10, ma20, ma60, rsi, macd, macd_signal, macd_hist,
+            boll_mid, boll_upper, boll_lower)
+
+
+if _NUMBA_AVAILABLE:
+    _compute_indicators = numba.njit(cache=True, fastmath=True)(
+        _compute_indicators_py)
+    _compute_indicators(np.zeros(1))
+else:
+    _compute_indicators = _compute_indicators_py
+
+
+_POSSIBLE_CSV_PATHS = (
+    'all_stocks.csv',
+    os.path.join('data', 'all_stocks.csv'),
+    os.path.join('..', 'all_stocks.csv'),
+    os.path.join(os.path.dirname(__file__), '..', '..', 'all_stocks.csv'),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_csv_path():
+    """Stat the candidate all_stocks.csv locations once per process."""
+    for path in _POSSIBLE_CSV_PATHS:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _load_stock_index():
+    """Build the ``{code: (name, exchange)}`` lookup from all_stocks.csv.
+
+    The CSV is located, parsed and normalized exactly once per process;
+    every collector instantiation afterwards is a dict hit instead of a
+    fresh read_csv plus row-wise normalization.
+    """
+    path = _resolve_csv_path()
+    if path is None:
+        return {}
+    try:
+        # Only three columns matter; naming them keeps the C parser on
+        # a straight string path with no dtype inference, and
+        # keep_default_na leaves blanks as '' instead of NaN.
+        df = pd.read_csv(path, engine='c',
+                         usecols=['code', 'zwjc', 'column'],
+                         dtype=str, keep_default_na=False)
+    except Exception:
+        return {}
+    codes = df['code'].str.strip()
+    exchanges = df['column'].str.strip().str.lower()
+    normalized = np.where(exchanges == 'hke',
+                          codes.str.zfill(5), codes.str.zfill(6))
+    return dict(zip(normalized, zip(df['zwjc'], exchanges)))
+
+
+def _write_output_job(job):
+    path, df = job
+    if path.endswith('.parquet'):
+        df.to_parquet(path, compression='zstd')
+    else:
+        df.to_csv(path, index=False, encoding='utf-8-sig')
+
+
+_DIGIT_RE = re.compile(r'^\d+$')
+
+# Resolved once at import: hasattr/getattr walk akshare's huge module
+# dict, which is wasted work when repeated per ticker. APIs missing
+# from the installed akshare simply drop out of the tuple.
+_FINANCIAL_APIS = tuple(
+    (func, data_name)
+    for func, data_name in (
+        (getattr(ak, api_name, None), data_name)
+        for api_name, data_name in (
+            ('stock_financial_analysis_indicator', 'Financial Indicators'),
+            ('stock_financial_abstract', 'Financial Abstract'),
+            ('stock_financial_report_sina', 'Financial Report'),
+        ))
+    if func is not None)
+
+
+@functools.lru_cache(maxsize=4096)
+def _lookup_entry(stock_code):
+    """Find the ``(name, exchange)`` index entry for any code variant.
+
+    Memoized per raw code string: re-instantiating a collector for a
+    ticker already seen in this process (retries, notebook re-runs)
+    skips even the strip/zfill variant probing.
+    """
+    index = _load_stock_index()
+    code = str(stock_code).strip()
+    for variant in (code, code.zfill(6), code.zfill(5)):
+        entry = index.get(variant)
+        if entry is not None:
+            return entry
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_code(stock_code, exchange_type):
+    """Zero-pad a code to its exchange's width (5 for HKE, 6 for A).
+
+    Memoized: init and the mapping fallback normalize the same ticker
+    repeatedly, so repeats are dict hits rather than fresh validation
+    plus an exchange lookup.
+    """
+    code = stock_code.strip()
+    if not code:
+        raise ValueError('Stock code must not be empty')
+    if _DIGIT_RE.match(code) is None:
+        logger.debug('Non-numeric stock code left as-is: %s', code)
+        return code
+    if exchange_type is None:
+        entry = _lookup_entry(code)
+        exchange_type = entry[1] if entry is not None else 'ashare'
+    if exchange_type == 'hke':
+        if len(code) > 5:
+            raise ValueError(f'Invalid HKE stock code: {code}')
+        return code.zfill(5)
+    if len(code) > 6:
+        raise ValueError(f'Invalid stock code: {code}')
+    return code.zfill(6)
+
+
+class StockDataCollector:
+    """Collect and persist all available data for one stock."""
+
+    _PRICE_RENAME = {
+        '日期': 'date',
+        '开盘': 'open',
+        '收盘': 'close',
+        '最高': 'high',
+        '最低': 'low',
+        '成交量': 'volume',
+        '成交额': 'amount',
+        '振幅': 'amplitude',
+        '涨跌幅': 'change_percent',
+        '涨跌额': 'change_amount',
+        '换手率': 'turnover',
+    }
+    _MA_WINDOWS = (TECHNICAL_INDICATORS['MA5'], TECHNICAL_INDICATORS['MA10'],
+                   TECHNICAL_INDICATORS['MA20'], TECHNICAL_INDICATORS['MA60'])
+
+    def __init__(self, stock_code, output_dir='stock_data'):
+        self.exchange_type = self._get_exchange_type(stock_code)
+        self.stock_code = self._normalize_stock_code(
+            stock_code, self.exchange_type)
+        self.company_name = self._get_company_name(self.stock_code)
+        self.output_dir = output_dir
+        self.data_dir = os.path.join(output_dir, self.stock_code)
+        ensure_directory_exists(self.data_dir)
+
+    # ------------------------------------------------------------------
+    # Code / name resolution
+    # ------------------------------------------------------------------
+
+    def _get_exchange_type(self, stock_code):
+        """Look the exchange up in the stock index; A-share by default."""
+        entry = _lookup_entry(stock_code)
+        return entry[1] if entry is not None else 'ashare'
+
+    def _get_company_name_from_csv(self, stock_code):
+        entry = _lookup_entry(stock_code)
+        return entry[0] if entry is not None else None
+
+    def _get_company_name_from_mapping(self, stock_code):
+        # The exchange is already resolved on self; passing it skips a
+        # second stock-index lookup inside the normalization.
+        normalized = self._normalize_stock_code(
+            stock_code, self.exchange_type)
+        return _NAME_MAP.get(normalized)
+
+    def _get_company_name(self, stock_code):
+        name = self._get_company_name_from_csv(stock_code)
+        if name is None:
+            name = self._get_company_name_from_mapping(stock_code)
+        if name is None:
+            logger.debug('Company name not found for %s', stock_code)
+            name = f'Stock {stock_code}'
+        return name
+
+    def _get_listing_date(self, stock_code):
+        return _LISTING_DATE_MAP.get(stock_code, 'Unknown')
+
+    def _get_industry(self, stock_code):
+        return _INDUSTRY_MAP.get(stock_code, 'Unknown')
+
+    def _normalize_stock_code(self, stock_code, exchange_type=None):
+        return _normalize_code(str(stock_code), exchange_type)
+
+    # ------------------------------------------------------------------
+    # AkShare access
+    # ------------------------------------------------------------------
+
+    def safe_akshare_call(self, func, *args, **kwargs):
+        """Call an AkShare API with retries; ``None`` when all fail.
+
+        Transient failures back off exponentially with a little jitter;
+        logic errors (unknown symbol, bad arguments) abort immediately
+        since retrying cannot change the answer.
+        """
+        for attempt in range(MAX_RETRIES):
+            try:
+                # Suppression is scoped to the remote call itself; the
+                # process-wide filter it replaces hid every warning in
+                # the program and taxed each warnings.warn lookup.
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore', category=FutureWarning)
+                    result = func(*args, **kwargs)
+            except (KeyError, ValueError, TypeError) as exc:
+                logger.warning('API call rejected: %s', exc)
+                return None
+            except Exception as exc:
+                logger.warning('API call failed (attempt %d): %s',
+                               attempt + 1, exc)
+                if attempt < MAX_RETRIES - 1:
+                    time.sleep(min(
+                        RETRY_DELAY * 2 ** attempt
+                        + random.random() * 0.25, 10))
+                continue
+            if result is not None and not (
+                    hasattr(result, 'empty') and result.empty):
+                return result
+            # Empty results retry too, but on the same backoff as
+            # failures -- an immediate re-call just hammers the
+            # endpoint that has nothing for us yet.
+            logger.warning('API call returned no data (attempt %d)',
+                           attempt + 1)
+            if attempt < MAX_RETRIES - 1:
+                time.sleep(min(
+                    RETRY_DELAY * 2 ** attempt
+                    + random.random() * 0.25, 10))
+        return None
+
+    def get_stock_basic_info(self):
+        """Static facts about the stock plus AkShare's per-stock details."""
+        info = {
+            'Stock Code': self.stock_code,
+            'Company Name': self.company_name,
+            'Exchange': self.exchange_type,
+            'Listing Date': self._get_listing_date(self.stock_code),
+            'Industry': self._get_industry(self.stock_code),
+        }
+        detail = self.safe_akshare_call(
+            ak.stock_individual_info_em, symbol=self.stock_code)
+        if detail is not None:
+            for _, row in detail.iterrows():
+                info[str(row['item'])] = row['value']
+        return info
+
+    def get_price_data(self, start_date=None, end_date=None, years=2):
+        """Daily K-line history with technical indicators attached."""
+        if self.exchange_type == 'hke':
+            logger.info('Price data is not collected for HKE stocks')
+            return None
+        if end_date is None:
+            end_date = pd.Timestamp.now().strftime('%Y%m%d')
+        if start_date is None:
+            start_date = (pd.Timestamp.now()
+                          - pd.DateOffset(years=years)).strftime('%Y%m%d')
+        daily_data = self.safe_akshare_call(
+            ak.stock_zh_a_hist, symbol=self.stock_code, period='daily',
+            start_date=start_date, end_date=end_date, adjust='qfq')
+        if daily_data is None or daily_data.empty:
+            return None
+        daily_data = daily_data.rename(columns=self._PRICE_RENAME)
+        # float32 halves the bytes the rolling passes (and every later
+        # consumer) stream through memory; daily bars are nowhere near
+        # float32's precision limits.
+        for column in ('open', 'close', 'high', 'low', 'amount',
+                       'amplitude', 'change_percent', 'change_amount',
+                       'turnover'):
+            if column in daily_data.columns:
+                daily_data[column] = pd.to_numeric(
+                    daily_data[column], downcast='float')
+        if 'volume' in daily_data.columns:
+            daily_data['volume'] = pd.to_numeric(
+                daily_data['volume'], downcast='integer')
+        return self.add_technical_indicators(daily_data)
+
+    def add_technical_indicators(self, data):
+        """Moving averages, RSI, MACD and Bollinger bands on the close."""
+        if _NUMBA_AVAILABLE:
+            (ma5, ma10, ma20, ma60, rsi, macd, macd_signal, macd_hist,
+             boll_mid, boll_upper, boll_lower) = _compute_indicators(
+                data['close'].to_numpy(dtype=np.float64))
+            data['MA5'] = ma5
+            data['MA10'] = ma10
+            data['MA20'] = ma20
+            data['MA60'] = ma60
+            data['RSI'] = rsi
+            data['MACD'] = macd
+            data['MACD_signal'] = macd_signal
+            data['MACD_hist'] = macd_hist
+            data['BOLL_mid'] = boll_mid
+            data['BOLL_upper'] = boll_upper
+            data['BOLL_lower'] = boll_lower
+            return data
+        close = data['close']
+        rsi_window = TECHNICAL_INDICATORS['RSI']
+        boll_window = TECHNICAL_INDICATORS['BOLL']
+        if _BOTTLENECK_AVAILABLE:
+            close_arr = close.to_numpy(dtype=np.float64)
+            for window in self._MA_WINDOWS:
+                data[f'MA{window}'] = bn.move_mean(
+                    close_arr, window=window, min_count=window)
+            delta = np.diff(close_arr, prepend=np.nan)
+            gains = np.where(delta > 0.0, delta, 0.0)
+            losses = np.where(delta < 0.0, -delta, 0.0)
+            nan_mask = np.isnan(delta)
+            gains[nan_mask] = np.nan
+            losses[nan_mask] = np.nan
+            gain = bn.move_mean(gains, window=rsi_window,
+                                min_count=rsi_window)
+            loss = bn.move_mean(losses, window=rsi_window,
+                                min_count=rsi_window)
+            boll_mid = bn.move_mean(close_arr, window=boll_window,
+                                    min_count=boll_window)
+            boll_std = bn.move_std(close_arr, window=boll_window,
+                                   min_count=boll_window, ddof=1)
+        else:
+            for window in self._MA_WINDOWS:
+                data[f'MA{window}'] = close.rolling(window=window).mean()
+            delta = close.diff()
+            gain = delta.where(delta > 0, 0.0).rolling(
+                window=rsi_window).mean()
+            loss = (-delta.where(delta < 0, 0.0)).rolling(
+                window=rsi_window).mean()
+            boll_mid = close.rolling(window=boll_window).mean()
+            boll_std = close.rolling(window=boll_window).std()
+
+        rs = gain / loss
+        data['RSI'] = 100 - 100 / (1 + rs)
+
+        ema12 = close.ewm(span=12, adjust=False).mean()
+        ema26 = close.ewm(span=26, adjust=False).mean()
+        data['MACD'] = ema12 - ema26
+        data['MACD_signal'] = data['MACD'].ewm(span=9, adjust=False).mean()
+        data['MACD_hist'] = data['MACD'] - data['MACD_signal']
+        data['BOLL_mid'] = boll_mid
+        data['BOLL_upper'] = boll_mid + 2 * boll_std
+        data['BOLL_lower'] = boll_mid - 2 * boll_std
+        return data
+
+    def get_financial_data(self):
+        """Financial statement frames keyed by a readable data name."""
+        if self.exchange_type == 'hke':
+            logger.info('Financial data is not collected for HKE stocks')
+            return {}
+        financial_data = {}
+        for api_func, data_name in _FINANCIAL_APIS:
+            result = self.safe_akshare_call(
+                api_func, symbol=self.stock_code)
+            if result is not None:
+                financial_data[data_name] = result
+        return financial_data
+
+    def get_market_comparison_data(self):
+        """Benchmark index data for relative-performance comparison."""
+        index_data = self.safe_akshare_call(
+            ak.stock_zh_index_daily, symbol='sh000001')
+        if index_data is None:
+            return {}
+        return {'Index Data': index_data}
+
+    # ------------------------------------------------------------------
+    # Orchestration and output
+    # ------------------------------------------------------------------
+
+    def collect_stock_data(self, start_date=None, end_date=None, years=2):
+        """Run the full collection pipeline and save everything."""
+        logger.info('Collecting data for %s (%s)...',
+                    self.company_name, self.stock_code)
+        # The four steps are independent and network-bound, so they run
+        # concurrently: wall-clock drops to roughly the slowest call
+        # instead of the sum of all four.
+        futures = {
+            'Basic Info': _AKSHARE_POOL.submit(self.get_stock_basic_info),
+            'Market Comparison': _AKSHARE_POOL.submit(
+                self.get_market_comparison_data),
+        }
+        if self.exchange_type != 'hke':
+            futures['Price Data'] = _AKSHARE_POOL.submit(
+                self.get_price_data, start_date, end_date, years)
+            futures['Financial Data'] = _AKSHARE_POOL.submit(
+                self.get_financial_data)
+        all_data = {name: future.result()
+                    for name, future in futures.items()}
+        if self.exchange_type == 'hke':
+            # Those steps return nothing for HKE anyway; storing the
+            # empty results directly keeps pool slots for real work.
+            all_data['Price Data'] = None
+            all_data['Financial Data'] = {}
+
+        self.save_all_data(all_data)
+        self.create_detailed_report(all_data)
+        return all_data
+
+    def save_all_data(self, all_data):
+        """Persist every collected frame under the stock's data dir."""
+        jobs = []
+        basic_info = all_data.get('Basic Info')
+        if basic_info:
+            jobs.append((os.path.join(
+                self.data_dir, f'{self.stock_code}_Basic_Info.csv'),
+                pd.DataFrame([basic_info])))
+        price_data = all_data.get('Price Data')
+        if price_data is not None:
+            # The K-line frame is the big numeric one; parquet stores it
+            # columnar and compressed, so reloads skip text parsing and
+            # can read just the columns they need.
+            jobs.append((os.path.join(
+                self.data_dir, f'{self.stock_code}_Price_Data.parquet'),
+                price_data))
+        for section in ('Financial Data', 'Market Comparison'):
+            for data_name, df in (all_data.get(section) or {}).items():
+                safe_name = data_name.replace(' ', '_')
+                jobs.append((os.path.join(
+                    self.data_dir, f'{self.stock_code}_{safe_name}.csv'),
+                    df))
+        if not jobs:
+            return
+        # The files are independent, so serialization of one overlaps
+        # the disk latency of another instead of waiting file by file.
+        if len(jobs) == 1:
+            _write_output_job(jobs[0])
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as ex:
+                list(ex.map(_write_output_job, jobs))
+
+    def create_detailed_report(self, all_data):
+        """Summarize the collection into a JSON report."""
+        report = {
+            'stock_code': self.stock_code,
+            'company_name': self.company_name,
+            'exchange': self.exchange_type,
+            'collect_time': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'data_quality': {},
+        }
+        price_data = all_data.get('Price Data')
+        if price_data is not None and not price_data.empty:
+            # stock_zh_a_hist returns ascending dates, so the current
+            # price is the last row, not the first; iat avoids
+            # materializing an intermediate row Series.
+            close_idx = price_data.columns.get_loc('close')
+            report['price_summary'] = {
+                'rows': len(price_data),
+                'current_price': float(price_data.iat[-1, close_idx]),
+                'average_volume': float(
+                    price_data['volume'].to_numpy().mean()),
+                'lowest': float(price_data['low'].to_numpy().min()),
+                'highest': float(price_data['high'].to_numpy().max()),
+            }
+        for key, value in all_data.items():
+            if isinstance(value, pd.DataFrame):
+                report['data_quality'][key] = {
+                    'rows': len(value), 'columns': len(value.columns)}
+            elif isinstance(value, dict):
+                report['data_quality'][key] = {
+                    'entries': len(value)}
+        report_filename = os.path.join(
+            self.data_dir, f'{self.stock_code}_report.json')
+        if _ORJSON_AVAILABLE:
+            with open(report_filename, 'wb') as f:
+                f.write(orjson.dumps(
+                    report,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(report_filename, 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+        return report_filename
@@ -0,0 +1,170 @@
+"""Command-line entry point collecting stock data and company news."""
+
+import argparse
+import functools
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+from .utils import ensure_directory_exists
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+# Repeated agent calls tend to re-ask for the same company and range;
+# a completed collection is returned as-is instead of re-hitting the
+# remote endpoints.
+_collection_cache = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _collector_classes():
+    """Resolve the heavy collector imports once, on first use.
+
+    The collectors drag in pandas, akshare and (transitively) selenium;
+    deferring them keeps ``--help`` and argparse errors instant and
+    never loads the crawler stack at all under ``--no-news``.
+    """
+    from .collectors.news_crawler import NewsCrawler
+    from .collectors.stock_data_collector import StockDataCollector
+    return StockDataCollector, NewsCrawler
+
+
+@functools.lru_cache(maxsize=256)
+def _get_stock_collector(stock_code, output_dir):
+    """Build (or reuse) the collector for ``stock_code``.
+
+    Construction resolves the company name against the stock index, so
+    caching it keeps that lookup off the hot path of repeated calls.
+    """
+    return _collector_classes()[0](stock_code, output_dir=output_dir)
+
+
+def input_collection(stock_code, start_date=None, end_date=None, years=2,
+                     include_news=True, pages_per_month=3,
+                     news_concurrency=None, news_format='feather',
+                     news_chunksize=50_000, output_dir='collected_data',
+                     verbose=True):
+    """Collect stock data and, optionally, news for one company.
+
+    Returns ``(stock_data, news_data, output_dir)``; ``news_data`` is
+    ``None`` when the crawl is skipped or comes back empty.
+    Programmatic callers (the agent tools) pass ``verbose=False`` to
+    keep their stdout clean.
+    """
+    if end_date is None:
+        end_date = date.today().isoformat()
+    if start_date is None:
+        start_date = (date.today() - timedelta(days=365 * years)).isoformat()
+    # Parse once at the entry point: a malformed date fails here, before
+    # any network work, and the canonical form keeps cache keys stable
+    # across spelling variants of the same day.
+    start_date = date.fromisoformat(start_date.strip()).isoformat()
+    end_date = date.fromisoformat(end_date.strip()).isoformat()
+
+    cache_key = (stock_code, start_date, end_date, include_news,
+                 pages_per_month, news_format, output_dir)
+    cached = _collection_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Fail before any collection starts: a read-only output directory
+    # would otherwise be discovered only when the crawl tries to save.
+    if not ensure_directory_exists(output_dir):
+        raise OSError(f'Output directory is not writable: {output_dir}')
+
+    if verbose:
+        sys.stdout.write(f'开始采集 {stock_code} 的数据...\n'
+                         f'时间范围: {start_date} 至 {end_date}\n')
+
+    stock_collector = _get_stock_collector(
+        stock_code, os.path.join(output_dir, 'stock_data'))
+
+    news_data = None
+    if include_news:
+        news_crawler = _collector_classes()[1](
+            output_dir=os.path.join(output_dir, 'news_data'), visible=False,
+            save_format=news_format, save_chunksize=news_chunksize)
+        # Stock collection and the news crawl share nothing and both
+        # spend their time waiting on the network, so overlap them;
+        # wall time becomes the longer of the two instead of the sum.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            stock_future = pool.submit(
+                stock_collector.collect_stock_data,
+                start_date=start_date, end_date=end_date, years=years)
+            news_future = pool.submit(
+                news_crawler.crawl_news_by_monthly_ranges,
+                stock_collector.company_name, start_date, end_date,
+                pages_per_month=pages_per_month,
+                max_workers=news_concurrency)
+            try:
+                stock_data = stock_future.result()
+                news_data = news_future.result()
+            finally:
+                news_crawler.close()
+    else:
+        stock_data = stock_collector.collect_stock_data(
+            start_date=start_date, end_date=end_date, years=years)
+
+    if verbose:
+        print(f'采集完成: {stock_collector.company_name}')
+    result = (stock_data, news_data, output_dir)
+    _collection_cache[cache_key] = result
+    return result
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    """Build the CLI parser once; repeat invocations reuse it."""
+    parser = argparse.ArgumentParser(
+        description='Collect stock data and news for one company.')
+    parser.add_argument('stock_code', help='股票代码，例如 600519')
+    parser.add_argument('--start-date', help='起始日期 YYYY-MM-DD')
+    parser.add_argument('--end-date', help='结束日期 YYYY-MM-DD')
+    parser.add_argument('--years', type=int, default=2,
+                        help='未指定日期时回溯的年数')
+    parser.add_argument('--no-news', action='store_true',
+                        help='跳过新闻采集')
+    parser.add_argument('--pages', type=int, default=3,
+                        help='每月最多抓取的页数')
+    parser.add_argument('--concurrency', type=int, default=None,
+                        help='并行抓取月份的 worker 数（默认自动）')
+    parser.add_argument('--format', choices=('csv', 'feather', 'parquet'),
+                        default='feather', help='新闻数据的保存格式')
+    parser.add_argument('--chunksize', type=int, default=50_000,
+                        help='CSV 写出时每批的行数')
+    parser.add_argument('--output-dir', default='collected_data',
+                        help='输出根目录')
+    return parser
+
+
+def main():
+    args = _build_parser().parse_args()
+
+    stock_data, news_data, output_dir = input_collection(
+        args.stock_code, start_date=args.start_date, end_date=args.end_date,
+        years=args.years, include_news=not args.no_news,
+        pages_per_month=args.pages, news_concurrency=args.concurrency,
+        news_format=args.format, news_chunksize=args.chunksize,
+        output_dir=args.output_dir)
+
+    # One write for the whole block: on a line-buffered TTY each print
+    # would flush separately.
+    lines = ['', '========= 采集结果 =========',
+             f'股票代码: {args.stock_code}',
+             f'输出目录: {output_dir}']
+    if stock_data:
+        for name, value in stock_data.items():
+            status = '成功' if value is not None else '失败'
+            lines.append(f'  {name}: {status}')
+    if news_data is not None:
+        lines.append(f'  News: {len(news_data)} 条')
+    lines.append('============================')
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""Shared filesystem helpers for the collectors."""
+
+import functools
+import logging
+import os
+import shutil
+
+logger = logging.getLogger(__name__)
+
+# Directories already created this process; repeat calls (one per month
+# from the concurrent crawl workers) skip the syscall entirely.
+_created_dirs = set()
+
+
+@functools.lru_cache(maxsize=512)
+def _dir_writable(directory):
+    """Whether ``directory`` exists and is writable; cached per path."""
+    return os.path.isdir(directory) and os.access(directory, os.W_OK)
+
+
+def ensure_directory_exists(directory):
+    """Create ``directory`` (and parents); returns ``False`` on failure.
+
+    ``exist_ok=True`` already covers the already-exists case, so there
+    is no separate ``os.path.exists`` probe (and no race against other
+    workers creating the same directory). A directory that exists but
+    is not writable also counts as failure, so callers can bail before
+    doing work whose output could never be saved.
+    """
+    if directory in _created_dirs:
+        return True
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError as exc:
+        logger.warning('Could not create directory %s: %s', directory, exc)
+        return False
+    if not _dir_writable(directory):
+        logger.warning('Directory %s is not writable', directory)
+        return False
+    _created_dirs.add(directory)
+    return True
+
+
+def get_file_extension(filename):
+    """Return the lower-cased extension of ``filename`` without the dot."""
+    head, sep, ext = filename.rpartition('.')
+    if (not sep or not head or head.endswith(('/', '\\'))
+            or '/' in ext or '\\' in ext):
+        return ''
+    return ext.lower()
+
+
+def is_valid_csv_file(path, _known_exists=False):
+    """Check that ``path`` exists, is a CSV file and is non-empty.
+
+    The extension test runs first so non-CSV paths are rejected without
+    touching the filesystem; callers scanning a listing they already
+    hold can pass ``_known_exists=True`` to skip the stat entirely.
+    """
+    if not path.endswith(('.csv', '.CSV')):
+        return False
+    if _known_exists:
+        return True
+    try:
+        # One stat answers existence and size together.
+        return os.stat(path).st_size > 0
+    except OSError:
+        return False
+
+
+def filter_csvs(paths):
+    """Return the paths ending in ``.csv`` without per-path stat calls."""
+    return [p for p in paths if p.endswith(('.csv', '.CSV'))]
+
+
+def backup_file(path):
+    """Copy ``path`` to ``path.bak`` and return the backup path."""
+    backup_path = path + '.bak'
+    shutil.copy2(path, backup_path)
+    return backup_path
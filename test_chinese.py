@@ -0,0 +1,43 @@
+"""Quick diagnostic: verify Chinese text survives PDF extraction.
+
+Extracts one page with both the plain text extractor and the block
+extractor and reports whether either output contains Han characters.
+
+Usage: python test_chinese.py <pdf> [page]
+"""
+
+import os
+import re
+import sys
+
+from pdf_extractor.utils import open_pdf
+
+_HAN_RE = re.compile(r'[一-鿿]')
+
+
+def check_chinese_extraction(pdf_path, page_number=1):
+    # Shared cached handle; the extractors reuse the same parse.
+    doc = open_pdf(pdf_path, os.path.getmtime(pdf_path))
+    page = doc[page_number - 1]
+    text1 = page.get_text('text')
+    blocks = page.get_text('blocks')
+    text2 = '\n'.join(b[4] for b in blocks if b[6] == 0)
+
+    # One C-level regex scan per string, bailing at the first Han
+    # character, instead of a Python loop over every character of both
+    # texts.
+    has_chinese = any(_HAN_RE.search(t) for t in (text1, text2) if t)
+
+    print(f'plain text length: {len(text1)}')
+    print(f'block text length: {len(text2)}')
+    print(f'contains Chinese: {has_chinese}')
+    return has_chinese
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    pdf_path = sys.argv[1]
+    page_number = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    check_chinese_extraction(pdf_path, page_number)
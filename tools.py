@@ -0,0 +1,47 @@
+"""LangChain tools exposing the data-collection pipeline to the agent."""
+
+import functools
+from datetime import date
+
+from langchain_core.tools import tool
+
+from pydantic_schema import FinancialDataParams
+
+
+@functools.lru_cache(maxsize=1)
+def _get_collection_entry():
+    """Import the collection entry point on first tool call.
+
+    The pipeline drags in pandas and the crawler stack; deferring the
+    import keeps agent-graph construction fast, and an import failure
+    surfaces as a traceback at the actual call site instead of being
+    swallowed at module load.
+    """
+    from stock_data_news_collector.main import input_collection
+    return input_collection
+
+
+@tool(args_schema=FinancialDataParams)
+def collect_data_pipeline(company_name, stock_code, start_date, end_date,
+                          news_pages=3):
+    """采集指定公司的行情、财务与新闻数据，并返回保存位置摘要。"""
+    # Agents re-issue the same call with cosmetic variations; normalise
+    # here so those all hit the same input_collection cache entry.
+    # Digit padding is left to the collector, which pads per exchange
+    # (A-share codes to 6 digits, HK to 5).
+    stock_code = stock_code.strip()
+    start_date = date.fromisoformat(start_date.strip()).isoformat()
+    end_date = date.fromisoformat(end_date.strip()).isoformat()
+    news_pages = int(news_pages) if news_pages else 3
+
+    input_collection = _get_collection_entry()
+    stock_data, news_data, output_dir = input_collection(
+        stock_code, start_date=start_date, end_date=end_date,
+        pages_per_month=news_pages, verbose=False)
+    sections = sorted(
+        name for name, value in (stock_data or {}).items()
+        if value is not None)
+    news_rows = 0 if news_data is None else len(news_data)
+    return (f'{company_name}({stock_code}) 数据已保存到 {output_dir}；'
+            f'行情/财务部分: {"、".join(sections) or "无"}；'
+            f'新闻 {news_rows} 条。')
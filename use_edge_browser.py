@@ -0,0 +1,61 @@
+"""One-shot patcher switching the news crawler from Chrome to Edge.
+
+Useful on machines where only Edge (and its webdriver) is installed;
+the crawler source is rewritten in place with a backup next to it.
+"""
+
+import os
+import re
+import shutil
+import sys
+
+TARGET = os.path.join('stock_data_news_collector', 'collectors',
+                      'news_crawler.py')
+
+_REPLACEMENTS = {
+    'webdriver.Chrome': 'webdriver.Edge',
+    'ChromeOptions': 'EdgeOptions',
+    'chrome_options': 'edge_options',
+}
+# One alternation walks the buffer once instead of once per pattern;
+# longest-first ordering keeps overlapping names unambiguous.
+_PATTERN = re.compile('|'.join(
+    map(re.escape, sorted(_REPLACEMENTS, key=len, reverse=True))))
+
+
+def backup_file(file_path):
+    """Keep ``file_path``'s current content reachable as ``.backup``."""
+    if not os.path.lexists(file_path):
+        return None
+    backup_path = file_path + '.backup'
+    if os.path.lexists(backup_path):
+        os.remove(backup_path)
+    try:
+        # Zero-copy on the same filesystem; safe because the rewrite
+        # below replaces the original atomically instead of truncating
+        # the shared inode in place.
+        os.link(file_path, backup_path)
+    except OSError:
+        shutil.copyfile(file_path, backup_path)
+    return backup_path
+
+
+def modify_news_crawler(path=TARGET):
+    """Rewrite ``path`` to use Edge; returns ``True`` if it changed."""
+    with open(path, encoding='utf-8') as f:
+        content = f.read()
+    if 'webdriver.Edge' in content:
+        print(f'{path} 已使用 Edge，无需修改')
+        return False
+    backup_path = backup_file(path)
+    patched = _PATTERN.sub(lambda m: _REPLACEMENTS[m.group(0)], content)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(patched)
+    os.replace(tmp_path, path)
+    print(f'已改用 Edge：{path}（备份：{backup_path}）')
+    return True
+
+
+if __name__ == '__main__':
+    modify_news_crawler(sys.argv[1] if len(sys.argv) > 1 else TARGET)